@@ -5,7 +5,23 @@ for the back dials of the mechanism, including the Metonic, Saros, Games, and Ex
 """
 import pygame
 import math
+import numpy as np
 import ancient_config as config
+from ancient_drawing import draw_pointer, prepare_static_layer
+from ancient_math import build_spiral
+
+
+def polyline_to_strip(points, width):
+    """Converts a polyline into the outline of a filled strip of the given width.
+
+    Each vertex is offset by half the width along its normal (taken from the neighbouring
+    segments), giving the left edge forwards followed by the right edge backwards.
+    """
+    points = np.asarray(points, dtype=float)
+    tangents = np.gradient(points, axis=0)
+    tangents /= np.hypot(tangents[:, 0], tangents[:, 1])[:, None]
+    normals = np.column_stack([-tangents[:, 1], tangents[:, 0]]) * (width / 2)
+    return np.concatenate([points + normals, (points - normals)[::-1]]).tolist()
 
 
 class AncientBackRenderer:
@@ -14,187 +30,247 @@ class AncientBackRenderer:
     def __init__(self, screen, fonts):
         self.screen = screen
         self.fonts = fonts
-        self.WIDTH, self.HEIGHT = screen.get_size()
+        self._control_surfs = [self.fonts['medium'].render(line, True, config.TEXT_COLOR).convert_alpha()
+                               for line in ["Controls:", "UP/DOWN: Change Speed", "SPACE: Pause/Resume",
+                                            "TAB: Switch View"]]
+        # Day and speed captions are re-rendered only when their value changes
+        self._shown_day = self._day_surface = None
+        self._shown_speed = self._speed_surface = None
+        self._build_static_layers()
+
+    def _build_static_layers(self):
+        """Computes the dial geometry and pre-renders everything that does not move."""
+        self.WIDTH, self.HEIGHT = self.screen.get_size()
         # Adjust centers for upper and lower dials
         self.UPPER_CENTER = (self.WIDTH // 2, int(self.HEIGHT * 0.35))
         self.LOWER_CENTER = (self.WIDTH // 2, int(self.HEIGHT * 0.75))
+        self.GAMES_CENTER = (self.WIDTH * 0.85, self.HEIGHT * 0.25)  # Positioned on the top right
+        self.EXELIGMOS_CENTER = (self.WIDTH * 0.85, self.HEIGHT * 0.75)  # Positioned on the bottom right
+        self.METONIC_RADIUS = self.HEIGHT / 4
+        self.SAROS_RADIUS = self.HEIGHT / 4.5
+        self.SMALL_DIAL_RADIUS = self.HEIGHT / 16
+
+        self._metonic_bg = self._render_static(self._render_metonic_static)
+        self._saros_bg = self._render_static(self._render_saros_static)
+        self._games_bg = self._render_static(self._render_games_static)
+        self._exeligmos_bg = self._render_static(self._render_exeligmos_static)
+        self._legend_bg = self._render_static(self._render_legend_static)
+
+    def _render_static(self, render):
+        """Renders a static layer once and returns it with the area it covers."""
+        layer = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
+        render(layer)
+        layer = prepare_static_layer(layer)
+        return layer, layer.get_bounding_rect()
+
+    def _blit_static(self, static_layer):
+        layer, rect = static_layer
+        self.screen.blit(layer, rect, rect)
+
+    def on_resize(self):
+        """Recomputes the layout and the static layers after the display size changed."""
+        self._build_static_layers()
 
     def draw_background(self):
         self.screen.fill(config.BG_COLOR)
 
-    def _get_spiral_point(self, center, angle, distance_from_center):
-        x = center[0] + math.cos(angle) * distance_from_center
-        y = center[1] + math.sin(angle) * distance_from_center
-        return (x, y)
-
-    def draw_metonic_dial(self, current_day):
-        """Draws the upper Metonic spiral dial."""
-        dial_radius = self.HEIGHT / 4
-        total_months = 235
-        months_per_loop = 47  # 235 / 5 loops
-        spiral_loops = 5
-
-        # Draw the spiral path
-        points = []
-        for i in range(total_months * 4):  # 4 points per month for smoothness
-            angle = math.radians(i * (360 / (months_per_loop * 4)) - 90)
-            t = i / (total_months * 4)
-            radius = dial_radius - (t * dial_radius * 0.95)
-            point = self._get_spiral_point(self.UPPER_CENTER, angle, radius)
-            points.append(point)
+    def _spiral_points(self, center, dial_radius, shrink, total_months, months_per_loop):
+        """Returns the spiral path as an (N, 2) array of points."""
+        n_points = total_months * 4  # 4 points per month for smoothness
+        step_rad = 2 * math.pi / (months_per_loop * 4)
+        return build_spiral(float(center[0]), float(center[1]), n_points, float(dial_radius),
+                            shrink, step_rad, -math.pi / 2)
+
+    def _render_metonic_static(self, surface):
+        dial_radius = self.METONIC_RADIUS
+        total_months = config.METONIC_TOTAL_MONTHS
+        months_per_loop = config.METONIC_MONTHS_PER_LOOP
+
+        # Draw the spiral path as a filled strip; the polygon fill also covers its edge
+        # pixels, so a 1 px strip matches the former 2 px line.
+        points = self._spiral_points(self.UPPER_CENTER, dial_radius, 0.95, total_months, months_per_loop)
         if len(points) > 1:
-            pygame.draw.lines(self.screen, config.DIAL_COLOR, False, points, 2)
+            pygame.draw.polygon(surface, config.DIAL_COLOR, polyline_to_strip(points, 1))
 
         # Draw month markings and labels
+        # The marks are equally spaced in angle, so cos/sin are advanced by a fixed rotation
+        # (angle-sum identities) instead of being recomputed for every month.
+        cx, cy = self.UPPER_CENTER
+        step = 2 * math.pi / months_per_loop
+        step_cos, step_sin = math.cos(step), math.sin(step)
+        c, s = 0.0, -1.0  # cos/sin of the -90 degree starting angle
+        mark_length = 10
         for month_idx in range(total_months):
-            angle = math.radians(month_idx * (360 / months_per_loop) - 90)
             t = month_idx / total_months
             radius = dial_radius - (t * dial_radius * 0.95)
 
-            mark_length = 10
-            start_point = self._get_spiral_point(self.UPPER_CENTER, angle, radius - mark_length / 2)
-            end_point = self._get_spiral_point(self.UPPER_CENTER, angle, radius + mark_length / 2)
-            pygame.draw.line(self.screen, config.DIAL_COLOR, start_point, end_point, 1)
+            start_point = (cx + c * (radius - mark_length / 2), cy + s * (radius - mark_length / 2))
+            end_point = (cx + c * (radius + mark_length / 2), cy + s * (radius + mark_length / 2))
+            pygame.draw.line(surface, config.DIAL_COLOR, start_point, end_point, 1)
 
             # Draw month labels (simplified)
             if month_idx % 12 == 0:  # Label every 12th month
-                label_angle = math.radians(month_idx * (360 / months_per_loop) - 90)
                 label_radius = radius + 15
-                label_pos = self._get_spiral_point(self.UPPER_CENTER, label_angle, label_radius)
+                label_pos = (cx + c * label_radius, cy + s * label_radius)
 
                 month_name = config.METONIC_MONTHS[month_idx % 12]
                 text_surface = self.fonts['small'].render(month_name, True, config.TEXT_COLOR)
                 text_rect = text_surface.get_rect(center=label_pos)
-                self.screen.blit(text_surface, text_rect)
+                surface.blit(text_surface, text_rect)
+
+            c, s = c * step_cos - s * step_sin, s * step_cos + c * step_sin
+
+        # Hub disk, drawn last so it sits on top of the spiral; the pointer is drawn over it
+        pygame.draw.circle(surface, config.DIAL_COLOR, self.UPPER_CENTER, 8)
+
+    def draw_metonic_dial(self, current_day):
+        """Draws the upper Metonic spiral dial."""
+        self._blit_static(self._metonic_bg)
 
         # Draw pointer
-        synodic_month_days = 29.530589
-        current_month = (current_day / synodic_month_days) % total_months
+        dial_radius = self.METONIC_RADIUS
+        total_months = config.METONIC_TOTAL_MONTHS
+        current_month = (current_day / config.SYNODIC_MONTH_DAYS) % total_months
 
-        pointer_angle = math.radians(current_month * (360 / months_per_loop) - 90)
+        pointer_angle = current_month * (2 * math.pi / config.METONIC_MONTHS_PER_LOOP) - math.pi / 2
         pointer_t = current_month / total_months
         pointer_radius = dial_radius - (pointer_t * dial_radius * 0.95)
 
-        end_point = self._get_spiral_point(self.UPPER_CENTER, pointer_angle, pointer_radius)
-        pygame.draw.line(self.screen, config.POINTER_COLOR, self.UPPER_CENTER, end_point, 2)
-        pygame.draw.circle(self.screen, config.POINTER_COLOR, (int(end_point[0]), int(end_point[1])), 5)
-        pygame.draw.circle(self.screen, config.DIAL_COLOR, self.UPPER_CENTER, 8)
+        cx, cy = self.UPPER_CENTER
+        end_point = (cx + math.cos(pointer_angle) * pointer_radius, cy + math.sin(pointer_angle) * pointer_radius)
+        return [draw_pointer(self.screen, config.POINTER_COLOR, self.UPPER_CENTER, end_point, 3)]
 
-    def draw_saros_dial(self, current_day):
-        """Draws the lower Saros spiral dial for eclipse prediction."""
-        dial_radius = self.HEIGHT / 4.5
-        total_months = 223
-        months_per_loop = 55.75  # 223 / 4 loops
+    def _render_saros_static(self, surface):
+        dial_radius = self.SAROS_RADIUS
+        total_months = config.SAROS_TOTAL_MONTHS
+        months_per_loop = config.SAROS_MONTHS_PER_LOOP
 
         # Draw the spiral path (4 loops)
-        points = []
-        for i in range(total_months * 4):  # 4 points per month for smoothness
-            angle = math.radians(i * (360 / (months_per_loop * 4)) - 90)
-            t = i / (total_months * 4)
-            radius = dial_radius - (t * dial_radius * 0.9)
-            point = self._get_spiral_point(self.LOWER_CENTER, angle, radius)
-            points.append(point)
+        points = self._spiral_points(self.LOWER_CENTER, dial_radius, 0.9, total_months, months_per_loop)
         if len(points) > 1:
-            pygame.draw.lines(self.screen, config.DIAL_COLOR, False, points, 2)
+            pygame.draw.polygon(surface, config.DIAL_COLOR, polyline_to_strip(points, 1))
 
         # Draw month markings and eclipse glyphs (simplified)
         # In a real reconstruction, these would be based on complex astronomical data.
         # Here, we'll just mark a few for visual effect.
+        cx, cy = self.LOWER_CENTER
+        step = 2 * math.pi / months_per_loop
+        step_cos, step_sin = math.cos(step), math.sin(step)
+        c, s = 0.0, -1.0  # cos/sin of the -90 degree starting angle
         for month_idx in range(total_months):
-            angle = math.radians(month_idx * (360 / months_per_loop) - 90)
             t = month_idx / total_months
             radius = dial_radius - (t * dial_radius * 0.9)
 
-            start_point = self._get_spiral_point(self.LOWER_CENTER, angle, radius - 3)
-            end_point = self._get_spiral_point(self.LOWER_CENTER, angle, radius + 3)
-            pygame.draw.line(self.screen, config.DIAL_COLOR, start_point, end_point, 1)
+            start_point = (cx + c * (radius - 3), cy + s * (radius - 3))
+            end_point = (cx + c * (radius + 3), cy + s * (radius + 3))
+            pygame.draw.line(surface, config.DIAL_COLOR, start_point, end_point, 1)
 
             # Example eclipse glyphs
             if month_idx in [18, 41, 72, 110, 155, 200]:
-                glyph_pos = self._get_spiral_point(self.LOWER_CENTER, angle, radius + 10)
+                glyph_pos = (cx + c * (radius + 10), cy + s * (radius + 10))
                 glyph = "Σ" if month_idx % 2 == 0 else "Η"  # Sigma for Lunar, Eta for Solar
                 text_surface = self.fonts['small'].render(glyph, True, (255, 100, 100))
                 text_rect = text_surface.get_rect(center=glyph_pos)
-                self.screen.blit(text_surface, text_rect)
+                surface.blit(text_surface, text_rect)
+
+            c, s = c * step_cos - s * step_sin, s * step_cos + c * step_sin
+
+        # Hub disk
+        pygame.draw.circle(surface, config.DIAL_COLOR, self.LOWER_CENTER, 8)
+
+    def draw_saros_dial(self, current_day):
+        """Draws the lower Saros spiral dial for eclipse prediction."""
+        self._blit_static(self._saros_bg)
 
         # Draw pointer
-        synodic_month_days = 29.530589
-        current_month_in_saros = (current_day / synodic_month_days) % total_months
+        dial_radius = self.SAROS_RADIUS
+        total_months = config.SAROS_TOTAL_MONTHS
+        current_month_in_saros = (current_day / config.SYNODIC_MONTH_DAYS) % total_months
 
-        pointer_angle = math.radians(current_month_in_saros * (360 / months_per_loop) - 90)
+        pointer_angle = current_month_in_saros * (2 * math.pi / config.SAROS_MONTHS_PER_LOOP) - math.pi / 2
         pointer_t = current_month_in_saros / total_months
         pointer_radius = dial_radius - (pointer_t * dial_radius * 0.9)
 
-        end_point = self._get_spiral_point(self.LOWER_CENTER, pointer_angle, pointer_radius)
-        pygame.draw.line(self.screen, config.POINTER_COLOR, self.LOWER_CENTER, end_point, 2)
-        pygame.draw.circle(self.screen, config.POINTER_COLOR, (int(end_point[0]), int(end_point[1])), 4)
-        pygame.draw.circle(self.screen, config.DIAL_COLOR, self.LOWER_CENTER, 8)
+        cx, cy = self.LOWER_CENTER
+        end_point = (cx + math.cos(pointer_angle) * pointer_radius, cy + math.sin(pointer_angle) * pointer_radius)
+        return [draw_pointer(self.screen, config.POINTER_COLOR, self.LOWER_CENTER, end_point, 3)]
 
-    def draw_games_dial(self, current_day):
-        """Draws the small Games dial."""
-        dial_radius = self.HEIGHT / 16
-        dial_center = (self.WIDTH * 0.85, self.HEIGHT * 0.25)  # Positioned on the top right
+    def _render_games_static(self, surface):
+        dial_radius = self.SMALL_DIAL_RADIUS
+        dial_center = self.GAMES_CENTER
+        cx, cy = dial_center
+        cos, sin = math.cos, math.sin
+        step_rad = math.pi / 2
 
-        pygame.draw.circle(self.screen, config.DIAL_COLOR, dial_center, dial_radius, 1)
+        pygame.draw.circle(surface, config.DIAL_COLOR, dial_center, dial_radius, 1)
 
         # Draw the 4 sectors
         for i in range(4):
-            angle = math.radians(i * 90 - 45)
-            end_angle = math.radians((i + 1) * 90 - 45)
+            angle = i * step_rad - math.pi / 4
 
             # Draw sector lines
-            start_pos = self._get_spiral_point(dial_center, angle, 0)
-            end_pos = self._get_spiral_point(dial_center, angle, dial_radius)
-            pygame.draw.line(self.screen, config.DIAL_COLOR, dial_center, end_pos, 1)
+            end_pos = (cx + cos(angle) * dial_radius, cy + sin(angle) * dial_radius)
+            pygame.draw.line(surface, config.DIAL_COLOR, dial_center, end_pos, 1)
 
             # Draw labels
             game1, game2 = config.GAMES_INSCRIPTIONS[i + 1]
 
-            label_angle = math.radians(i * 90)
-            text_pos1 = self._get_spiral_point(dial_center, label_angle, dial_radius * 0.6)
+            label_angle = i * step_rad
+            text_pos1 = (cx + cos(label_angle) * dial_radius * 0.6, cy + sin(label_angle) * dial_radius * 0.6)
             text_surface1 = self.fonts['small'].render(game1[:4], True, config.TEXT_COLOR)
-            self.screen.blit(text_surface1, text_surface1.get_rect(center=text_pos1))
+            surface.blit(text_surface1, text_surface1.get_rect(center=text_pos1))
+
+    def draw_games_dial(self, current_day):
+        """Draws the small Games dial."""
+        self._blit_static(self._games_bg)
 
         # Draw pointer
         year_in_cycle = int((current_day / 365.25) % 4)
-        pointer_angle = math.radians(year_in_cycle * 90)
+        pointer_angle = year_in_cycle * (math.pi / 2)
 
-        end_point = self._get_spiral_point(dial_center, pointer_angle, dial_radius)
-        pygame.draw.line(self.screen, config.POINTER_COLOR, dial_center, end_point, 2)
+        cx, cy = self.GAMES_CENTER
+        end_point = (cx + math.cos(pointer_angle) * self.SMALL_DIAL_RADIUS,
+                     cy + math.sin(pointer_angle) * self.SMALL_DIAL_RADIUS)
+        return [draw_pointer(self.screen, config.POINTER_COLOR, self.GAMES_CENTER, end_point, 2)]
 
-    def draw_exeligmos_dial(self, current_day):
-        """Draws the small Exeligmos dial."""
-        dial_radius = self.HEIGHT / 16
-        dial_center = (self.WIDTH * 0.85, self.HEIGHT * 0.75)  # Positioned on the bottom right
+    def _render_exeligmos_static(self, surface):
+        dial_radius = self.SMALL_DIAL_RADIUS
+        dial_center = self.EXELIGMOS_CENTER
+        cx, cy = dial_center
+        cos, sin = math.cos, math.sin
+        step_rad = 2 * math.pi / 3
 
-        pygame.draw.circle(self.screen, config.DIAL_COLOR, dial_center, dial_radius, 1)
+        pygame.draw.circle(surface, config.DIAL_COLOR, dial_center, dial_radius, 1)
 
         # Draw the 3 sectors
         for i in range(3):
-            angle = math.radians(i * 120 - 30)
+            angle = i * step_rad - math.pi / 6
 
             # Draw sector lines
-            end_pos = self._get_spiral_point(dial_center, angle, dial_radius)
-            pygame.draw.line(self.screen, config.DIAL_COLOR, dial_center, end_pos, 1)
+            end_pos = (cx + cos(angle) * dial_radius, cy + sin(angle) * dial_radius)
+            pygame.draw.line(surface, config.DIAL_COLOR, dial_center, end_pos, 1)
 
             # Draw labels
-            label_angle = math.radians(i * 120 + 30)
-            label_pos = self._get_spiral_point(dial_center, label_angle, dial_radius * 0.7)
+            label_angle = i * step_rad + math.pi / 6
+            label_pos = (cx + cos(label_angle) * dial_radius * 0.7, cy + sin(label_angle) * dial_radius * 0.7)
             text_surface = self.fonts['medium'].render(config.EXELIGMOS_LABELS[i], True, config.TEXT_COLOR)
-            self.screen.blit(text_surface, text_surface.get_rect(center=label_pos))
+            surface.blit(text_surface, text_surface.get_rect(center=label_pos))
+
+    def draw_exeligmos_dial(self, current_day):
+        """Draws the small Exeligmos dial."""
+        self._blit_static(self._exeligmos_bg)
 
         # Draw pointer
-        saros_cycle_days = 6585.3211
-        exeligmos_period_in_saros = 3
-        current_saros_cycle = (current_day / saros_cycle_days)
-        exeligmos_segment = int(current_saros_cycle % exeligmos_period_in_saros)
+        current_saros_cycle = (current_day / config.SAROS_CYCLE_DAYS)
+        exeligmos_segment = int(current_saros_cycle % config.EXELIGMOS_PERIOD_IN_SAROS)
 
-        pointer_angle = math.radians(exeligmos_segment * 120 + 30)
-        end_point = self._get_spiral_point(dial_center, pointer_angle, dial_radius)
-        pygame.draw.line(self.screen, config.POINTER_COLOR, dial_center, end_point, 2)
+        pointer_angle = exeligmos_segment * (2 * math.pi / 3) + math.pi / 6
+        cx, cy = self.EXELIGMOS_CENTER
+        end_point = (cx + math.cos(pointer_angle) * self.SMALL_DIAL_RADIUS,
+                     cy + math.sin(pointer_angle) * self.SMALL_DIAL_RADIUS)
+        return [draw_pointer(self.screen, config.POINTER_COLOR, self.EXELIGMOS_CENTER, end_point, 2)]
 
-    def draw_legend(self):
-        """Draws a legend explaining the dials."""
+    def _render_legend_static(self, surface):
         legend_x = 20
         legend_y = self.HEIGHT - 140
         line_height = 22
@@ -207,22 +283,30 @@ class AncientBackRenderer:
         ]
 
         title_surface = self.fonts['medium'].render("Back Face Dials", True, config.TEXT_COLOR)
-        self.screen.blit(title_surface, (legend_x, legend_y))
+        surface.blit(title_surface, (legend_x, legend_y))
 
         for i, (title, desc) in enumerate(legend_items):
             y_pos = legend_y + (i + 1) * line_height
             title_surf = self.fonts['small'].render(title, True, config.POINTER_COLOR)
             desc_surf = self.fonts['small'].render(desc, True, config.TEXT_COLOR)
-            self.screen.blit(title_surf, (legend_x, y_pos))
-            self.screen.blit(desc_surf, (legend_x + title_surf.get_width() + 5, y_pos))
+            surface.blit(title_surf, (legend_x, y_pos))
+            surface.blit(desc_surf, (legend_x + title_surf.get_width() + 5, y_pos))
+
+    def draw_legend(self):
+        """Draws a legend explaining the dials."""
+        self._blit_static(self._legend_bg)
 
     def draw_ui(self, current_day, time_multiplier):
-        day_text = f"Day: {int(current_day)}"
-        day_surface = self.fonts['large'].render(day_text, True, config.TEXT_COLOR)
-        self.screen.blit(day_surface, (10, 10))
-
-        controls = ["Controls:", "UP/DOWN: Change Speed", "SPACE: Pause/Resume", "TAB: Switch View",
-                    f"Speed: {time_multiplier:.2f}x"]
-        for i, line in enumerate(controls):
-            text_surface = self.fonts['medium'].render(line, True, config.TEXT_COLOR)
+        day = int(current_day)
+        if day != self._shown_day:
+            self._day_surface = self.fonts['large'].render(f"Day: {day}", True, config.TEXT_COLOR).convert_alpha()
+            self._shown_day = day
+        day_rect = self.screen.blit(self._day_surface, (10, 10))
+
+        for i, text_surface in enumerate(self._control_surfs):
             self.screen.blit(text_surface, (10, 50 + i * 25))
+        if time_multiplier != self._shown_speed:
+            self._speed_surface = self.fonts['medium'].render(f"Speed: {time_multiplier:.2f}x", True, config.TEXT_COLOR).convert_alpha()
+            self._shown_speed = time_multiplier
+        speed_rect = self.screen.blit(self._speed_surface, (10, 50 + len(self._control_surfs) * 25))
+        return [day_rect, speed_rect]
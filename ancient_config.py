@@ -47,6 +47,15 @@ MOON_PHASE_NAMES = [
 ]
 
 # --- Back Face Dial Data ---
+SYNODIC_MONTH_DAYS = 29.530589
+SAROS_CYCLE_DAYS = 6585.3211
+
+METONIC_TOTAL_MONTHS = 235
+METONIC_MONTHS_PER_LOOP = 47  # 235 / 5 loops
+SAROS_TOTAL_MONTHS = 223
+SAROS_MONTHS_PER_LOOP = 55.75  # 223 / 4 loops
+EXELIGMOS_PERIOD_IN_SAROS = 3
+
 METONIC_MONTHS = [
     "PHOINIKAIOS", "KRANEIOS", "LANOTROPIOS", "MACHANEYS", "DODEKATEYS", "EUKLEIOS",
     "ARTEMISIOS", "PSYDRUS", "GAMEILIOS", "AGRIANIOS", "PANAMOS", "APELLAIOS"
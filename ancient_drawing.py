@@ -5,100 +5,199 @@ for a geocentric model based on the historical mechanism.
 """
 import pygame
 import math
+import numpy as np
 from datetime import datetime
 import ancient_config as config
 
+
+def circle_sprite(color, radius):
+    """Pre-renders a filled circle onto a small transparent surface."""
+    sprite = pygame.Surface((2 * radius + 2, 2 * radius + 2), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (radius + 1, radius + 1), radius)
+    return sprite.convert_alpha()
+
+
+def prepare_static_layer(layer):
+    """Converts a pre-rendered transparent layer to the display format and run-length encodes it.
+
+    Most of a static layer is fully transparent; with RLE the blit skips those pixels
+    instead of blending every one of them.
+    """
+    layer = layer.convert_alpha()
+    layer.set_alpha(255, pygame.RLEACCEL)
+    return layer
+
+
+def blit_centered(surface, sprite, center):
+    """Blits a sprite centered on a pixel position and returns the touched rect."""
+    return surface.blit(sprite, sprite.get_rect(center=(int(center[0]), int(center[1]))))
+
+
+def draw_pointer(surface, color, base, tip, half_width):
+    """Draws a pointer as one thin triangle from base to tip and returns the touched rect.
+
+    The triangle is widest at the tip, so it also stands in for the round marker
+    that used to be drawn there.
+    """
+    dx, dy = tip[0] - base[0], tip[1] - base[1]
+    length = math.hypot(dx, dy) or 1.0
+    nx, ny = -dy / length * half_width, dx / length * half_width
+    return pygame.draw.polygon(surface, color, [base, (tip[0] + nx, tip[1] + ny), (tip[0] - nx, tip[1] - ny)])
+
+
 class AncientRenderer:
     """Handles all rendering for the ancient simulation."""
     def __init__(self, screen, fonts):
         self.screen = screen
         self.fonts = fonts
-        self.WIDTH, self.HEIGHT = screen.get_size()
+        self._phase_surfs = [self.fonts['medium'].render(f"Moon: {name}", True, config.TEXT_COLOR).convert_alpha()
+                             for name in config.MOON_PHASE_NAMES]
+        self._control_surfs = [self.fonts['medium'].render(line, True, config.TEXT_COLOR).convert_alpha()
+                               for line in ["Controls:", "UP/DOWN: Change Speed", "SPACE: Pause/Resume"]]
+        # Per-planet data as parallel sequences in GEOCENTRIC_DATA order, matching the state's angle array
+        planets = config.GEOCENTRIC_DATA.values()
+        self._planet_names = list(config.GEOCENTRIC_DATA)
+        self._planet_line_colors = [(*data['color'], 80) for data in planets]
+        self._planet_label_offsets = np.array([data['size'] + 10 for data in planets], dtype=float)
+        self._planet_sprites = [circle_sprite(data['color'], data['size']) for data in planets]
+        self._planet_label_surfs = [self.fonts['planet'].render(name, True, data['color']).convert_alpha()
+                                    for name, data in config.GEOCENTRIC_DATA.items()]
+        # Day and speed captions are re-rendered only when their value changes
+        self._shown_day = self._day_surface = None
+        self._shown_speed = self._speed_surface = None
+        self._build_static_layers()
+
+    def _build_static_layers(self):
+        """Computes the dial geometry and pre-renders the dials, Earth and the planet orbits."""
+        self.WIDTH, self.HEIGHT = self.screen.get_size()
         self.CENTER = (self.WIDTH // 2, self.HEIGHT // 2)
-
-    def draw_background(self):
-        self.screen.fill(config.BG_COLOR)
-
-    def draw_celestial_bodies(self, body_angles):
-        # Draw central Earth
-        pygame.draw.circle(self.screen, (0, 150, 255), self.CENTER, 15)
+        self.ZODIAC_RADIUS = int(self.WIDTH / 2.5)
+        self.MONTH_RADIUS = self.ZODIAC_RADIUS - int(self.WIDTH / 15)
+        self.MOON_RADIUS = int(self.WIDTH / 15)
+        self.MOON_CENTER = (self.WIDTH - self.MOON_RADIUS - 30, self.MOON_RADIUS + 30)
 
         # Normalize distances to prevent clipping
         max_dist_raw = max(d['distance'] for d in config.GEOCENTRIC_DATA.values())
         max_screen_dist = self.WIDTH // 2 - 80 # Add some padding
-
-        for name, data in config.GEOCENTRIC_DATA.items():
-            normalized_dist = data['distance'] / max_dist_raw
-            orbit_radius = int(max_screen_dist * normalized_dist)
-            angle = body_angles[name]
-            x = self.CENTER[0] + orbit_radius * math.cos(angle)
-            y = self.CENTER[1] + orbit_radius * math.sin(angle)
-
-            pygame.draw.circle(self.screen, (*data['color'], 50), self.CENTER, orbit_radius, 1)
-            pygame.draw.line(self.screen, (*data['color'], 80), self.CENTER, (x, y), 1)
-            pygame.draw.circle(self.screen, data['color'], (int(x), int(y)), data['size'])
-
-            label_surface = self.fonts['planet'].render(name, True, data['color'])
-            label_x = x + (data['size'] + 10) * math.cos(angle)
-            label_y = y + (data['size'] + 10) * math.sin(angle)
-            self.screen.blit(label_surface, label_surface.get_rect(center=(label_x, label_y)))
-
-    def draw_front_dials(self, current_day):
-        zodiac_radius = int(self.WIDTH / 2.5)
-        month_radius = zodiac_radius - int(self.WIDTH / 15)
-
-        # Draw Zodiac Dial
-        pygame.draw.circle(self.screen, config.DIAL_COLOR, self.CENTER, zodiac_radius, 2)
+        self._orbit_radii = np.array([int(max_screen_dist * data['distance'] / max_dist_raw)
+                                      for data in config.GEOCENTRIC_DATA.values()], dtype=float)
+
+        self._dials_bg = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
+        self._render_dials_static(self._dials_bg)
+        self._dials_bg = prepare_static_layer(self._dials_bg)
+        self._dials_rect = self._dials_bg.get_bounding_rect()
+
+        # Orbit rings keep their translucency on this overlay, which the RGB display cannot do
+        self._orbits_overlay = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
+        for data, orbit_radius in zip(config.GEOCENTRIC_DATA.values(), self._orbit_radii):
+            pygame.draw.circle(self._orbits_overlay, (*data['color'], 50), self.CENTER, orbit_radius, 1)
+        self._orbits_overlay = prepare_static_layer(self._orbits_overlay)
+        self._orbits_rect = self._orbits_overlay.get_bounding_rect()
+
+    def _render_dials_static(self, surface):
+        zodiac_radius = self.ZODIAC_RADIUS
+        month_radius = self.MONTH_RADIUS
+
+        step_rad = math.pi / 6  # 30 degrees per sign and month
+        off = -math.pi / 2
+
+        # Zodiac Dial ring and sign dividers
+        pygame.draw.circle(surface, config.DIAL_COLOR, self.CENTER, zodiac_radius, 2)
         for i in range(12):
-            angle_deg = i * 30
-            angle_rad = math.radians(angle_deg - 90)
+            angle_rad = i * step_rad + off
             start_pos = (self.CENTER[0] + month_radius * math.cos(angle_rad), self.CENTER[1] + month_radius * math.sin(angle_rad))
             end_pos = (self.CENTER[0] + zodiac_radius * math.cos(angle_rad), self.CENTER[1] + zodiac_radius * math.sin(angle_rad))
-            pygame.draw.line(self.screen, config.DIAL_COLOR, start_pos, end_pos, 2)
-
-            label_angle_rad = math.radians(angle_deg - 15 - 90)
-            text_surface = self.fonts['zodiac'].render(config.ZODIAC_INSCRIPTIONS_GREEK[i], True, config.TEXT_COLOR)
+            pygame.draw.line(surface, config.DIAL_COLOR, start_pos, end_pos, 2)
+
+        # Egyptian Calendar Dial (354-day) ring and day ticks
+        pygame.draw.circle(surface, config.DIAL_COLOR, self.CENTER, month_radius, 2)
+        # Ticks are equally spaced, so cos/sin are advanced by a fixed rotation instead of recomputed
+        step = 2 * math.pi / 354
+        step_cos, step_sin = math.cos(step), math.sin(step)
+        c, s = 1.0, 0.0
+        segments = []
+        for i in range(354):
+            tick_len = 5 if i % 5 == 0 else 2
+            start_pos = (self.CENTER[0] + (month_radius - tick_len) * c, self.CENTER[1] + (month_radius - tick_len) * s)
+            end_pos = (self.CENTER[0] + month_radius * c, self.CENTER[1] + month_radius * s)
+            segments.append((start_pos, end_pos))
+            c, s = c * step_cos - s * step_sin, s * step_cos + c * step_sin
+        for start_pos, end_pos in segments:
+            pygame.draw.line(surface, config.TEXT_COLOR, start_pos, end_pos, 1)
+
+        # Zodiac Labels
+        for i, sign in enumerate(config.ZODIAC_INSCRIPTIONS_GREEK):
+            label_angle_rad = (i - 0.5) * step_rad + off
+            text_surface = self.fonts['zodiac'].render(sign, True, config.TEXT_COLOR)
             text_rect = text_surface.get_rect(center=(
                 self.CENTER[0] + (zodiac_radius - 20) * math.cos(label_angle_rad),
                 self.CENTER[1] + (zodiac_radius - 20) * math.sin(label_angle_rad)
             ))
-            self.screen.blit(text_surface, text_rect)
-
-        # Draw Egyptian Calendar Dial (354-day)
-        pygame.draw.circle(self.screen, config.DIAL_COLOR, self.CENTER, month_radius, 2)
-        for i in range(354):
-            angle = math.radians(i * (360 / 354))
-            tick_len = 5 if i % 5 == 0 else 2
-            start_pos = (self.CENTER[0] + (month_radius - tick_len) * math.cos(angle), self.CENTER[1] + (month_radius - tick_len) * math.sin(angle))
-            end_pos = (self.CENTER[0] + month_radius * math.cos(angle), self.CENTER[1] + month_radius * math.sin(angle))
-            pygame.draw.line(self.screen, config.TEXT_COLOR, start_pos, end_pos, 1)
+            surface.blit(text_surface, text_rect)
 
-        # Draw Egyptian Month Labels
+        # Egyptian Month Labels
         for i, month in enumerate(config.EGYPTIAN_MONTHS):
-            angle_rad = math.radians(i * 30 - 15 - 90)
+            angle_rad = (i - 0.5) * step_rad + off
             text_surface = self.fonts['small'].render(month, True, config.TEXT_COLOR)
             text_rect = text_surface.get_rect(center=(
                 self.CENTER[0] + (month_radius - 25) * math.cos(angle_rad),
                 self.CENTER[1] + (month_radius - 25) * math.sin(angle_rad)
             ))
-            self.screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
+
+        # Central Earth
+        pygame.draw.circle(surface, (0, 150, 255), self.CENTER, 15)
+
+    def on_resize(self):
+        """Recomputes the layout and the static layers after the display size changed."""
+        self._build_static_layers()
+
+    def draw_background(self):
+        self.screen.fill(config.BG_COLOR)
+
+    def draw_celestial_bodies(self, angles):
+        """Draws the planets from an array of angles in GEOCENTRIC_DATA order."""
+        # Earth is part of the pre-rendered dial layer
+        self.screen.blit(self._orbits_overlay, self._orbits_rect, self._orbits_rect)
+
+        # Project every body at once; the loop below only draws
+        cos_a, sin_a = np.cos(angles), np.sin(angles)
+        xs = self.CENTER[0] + self._orbit_radii * cos_a
+        ys = self.CENTER[1] + self._orbit_radii * sin_a
+        label_xs = xs + self._planet_label_offsets * cos_a
+        label_ys = ys + self._planet_label_offsets * sin_a
+
+        dirty_rects = []
+        for x, y, label_x, label_y, line_color, sprite, label_surface in zip(
+                xs.tolist(), ys.tolist(), label_xs.tolist(), label_ys.tolist(),
+                self._planet_line_colors, self._planet_sprites, self._planet_label_surfs):
+            dirty_rects.append(pygame.draw.line(self.screen, line_color, self.CENTER, (x, y), 1))
+            dirty_rects.append(blit_centered(self.screen, sprite, (x, y)))
+            dirty_rects.append(self.screen.blit(label_surface, label_surface.get_rect(center=(label_x, label_y))))
+        return dirty_rects
+
+    def draw_front_dials(self, current_day):
+        zodiac_radius = self.ZODIAC_RADIUS
+        month_radius = self.MONTH_RADIUS
+
+        # Dial rings, ticks and inscriptions are pre-rendered
+        self.screen.blit(self._dials_bg, self._dials_rect, self._dials_rect)
 
         # Draw Date Pointer for 354-day cycle
-        date_angle = math.radians((current_day % 354 / 354) * 360 - 90)
+        date_angle = (current_day % 354) * (2 * math.pi / 354) - math.pi / 2
         start_x = self.CENTER[0] + (month_radius - 40) * math.cos(date_angle)
         start_y = self.CENTER[1] + (month_radius - 40) * math.sin(date_angle)
         end_x = self.CENTER[0] + zodiac_radius * math.cos(date_angle)
         end_y = self.CENTER[1] + zodiac_radius * math.sin(date_angle)
-        pygame.draw.line(self.screen, config.POINTER_COLOR, (start_x, start_y), (end_x, end_y), 2)
-        pygame.draw.circle(self.screen, config.POINTER_COLOR, (int(end_x), int(end_y)), 4)
+        return [draw_pointer(self.screen, config.POINTER_COLOR, (start_x, start_y), (end_x, end_y), 3)]
 
     def draw_moon_phase(self, sun_angle, moon_angle):
         """Draws the large moon phase display with a simple fill/shrink animation."""
-        moon_radius = int(self.WIDTH / 15)
-        moon_display_center = (self.WIDTH - moon_radius - 30, moon_radius + 30)
+        moon_radius = self.MOON_RADIUS
+        moon_display_center = self.MOON_CENTER
 
         # Background for the display
-        pygame.draw.circle(self.screen, (20, 20, 30), moon_display_center, moon_radius + 10)
+        moon_rect = pygame.draw.circle(self.screen, (20, 20, 30), moon_display_center, moon_radius + 10)
 
         # Calculate phase
         angle_diff = (moon_angle - sun_angle + math.pi) % (2 * math.pi)
@@ -123,19 +222,22 @@ class AncientRenderer:
 
         # Label
         phase_index = int((phase * 8 + 0.5)) % 8
-        current_phase_name = config.MOON_PHASE_NAMES[phase_index]
-        phase_text_surface = self.fonts['medium'].render(f"Moon: {current_phase_name}", True, config.TEXT_COLOR)
-        self.screen.blit(phase_text_surface, (
-            moon_display_center[0] - phase_text_surface.get_width() // 2,
-            moon_display_center[1] + moon_radius + 15
-        ))
+        phase_text_surface = self._phase_surfs[phase_index]
+        label_rect = self.screen.blit(phase_text_surface, phase_text_surface.get_rect(
+            midtop=(moon_display_center[0], moon_display_center[1] + moon_radius + 15)))
+        return [moon_rect, label_rect]
 
     def draw_ui(self, current_day, time_multiplier):
-        day_text = f"Day: {int(current_day)}"
-        day_surface = self.fonts['large'].render(day_text, True, config.TEXT_COLOR)
-        self.screen.blit(day_surface, (10, 10))
+        day = int(current_day)
+        if day != self._shown_day:
+            self._day_surface = self.fonts['large'].render(f"Day: {day}", True, config.TEXT_COLOR).convert_alpha()
+            self._shown_day = day
+        day_rect = self.screen.blit(self._day_surface, (10, 10))
 
-        controls = ["Controls:", "UP/DOWN: Change Speed", "SPACE: Pause/Resume", f"Speed: {time_multiplier:.2f}x"]
-        for i, line in enumerate(controls):
-            text_surface = self.fonts['medium'].render(line, True, config.TEXT_COLOR)
+        for i, text_surface in enumerate(self._control_surfs):
             self.screen.blit(text_surface, (10, 50 + i * 25))
+        if time_multiplier != self._shown_speed:
+            self._speed_surface = self.fonts['medium'].render(f"Speed: {time_multiplier:.2f}x", True, config.TEXT_COLOR).convert_alpha()
+            self._shown_speed = time_multiplier
+        speed_rect = self.screen.blit(self._speed_surface, (10, 50 + len(self._control_surfs) * 25))
+        return [day_rect, speed_rect]
@@ -0,0 +1,41 @@
+"""
+Numeric helpers for the Ancient Antikythera Simulation.
+The functions here are compiled with Numba when it is installed and run as
+plain NumPy code otherwise, so Numba stays an optional speed-up.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def build_spiral(cx, cy, n_pts, r0, shrink, step_rad, off):
+    """Returns an (n_pts, 2) float32 array of points on a spiral around (cx, cy).
+
+    The radius shrinks linearly from r0 to r0 * (1 - shrink) while the angle
+    advances by step_rad per point, starting at off.
+    """
+    i = np.arange(n_pts)
+    angle = i * step_rad + off
+    radius = r0 - (i / n_pts) * r0 * shrink
+    points = np.empty((n_pts, 2), dtype=np.float32)
+    points[:, 0] = cx + np.cos(angle) * radius
+    points[:, 1] = cy + np.sin(angle) * radius
+    return points
+
+
+@njit(cache=True)
+def update_angles(day, inv_periods, out):
+    """Writes the angle of every body on the given day into out and returns it.
+
+    inv_periods holds 2 * pi / period for each body, so the angle is a single product.
+    """
+    out[:] = day * inv_periods
+    return out
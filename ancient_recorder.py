@@ -2,6 +2,8 @@ import pygame
 import numpy as np
 import cv2
 import os
+import queue
+import threading
 from PIL import Image
 from datetime import datetime
 from ancient_simulation import AncientAntikythera
@@ -12,12 +14,25 @@ import math
 class AncientSimulationRecorder:
     """Records the ancient simulation to GIF and MP4 formats."""
 
-    def __init__(self, app, output_dir="recordings"):
+    def __init__(self, app, output_dir="recordings", codec='avc1'):
         self.app = app
         self.output_dir = output_dir
+        self.codec = codec  # Tried with hardware acceleration first; 'mp4v' forces the software encoder
+        self._hw_encoder_available = None  # Probed on the first recording
         self.recording = False
         self.frames = []
         self.video_writer = None
+        # Frames are handed to a writer thread so encoding overlaps with drawing the next frame
+        self._frame_queue = queue.Queue(maxsize=4)
+        self._writer_thread = None
+        self._writer_error = None  # Exception raised by the video writer during the current recording
+        # Frame buffers are allocated once: an RGB staging buffer for the capture loop and a
+        # pool of BGR buffers that cycle between the capture loop and the writer thread.
+        frame_shape = (self.app.HEIGHT, self.app.WIDTH, 3)
+        self._rgb_buf = np.empty(frame_shape, dtype=np.uint8)
+        self._free_bgr_bufs = queue.Queue()
+        for _ in range(self._frame_queue.maxsize + 2):
+            self._free_bgr_bufs.put(np.empty(frame_shape, dtype=np.uint8))
         os.makedirs(output_dir, exist_ok=True)
 
     def start_recording(self, view, speed_multiplier, duration_seconds=10, formats=['mp4']):
@@ -42,11 +57,12 @@ class AncientSimulationRecorder:
         speed_name = f"speed_{speed_multiplier:.2f}x".replace('.', '_')
         base_filename = f"ancient_{view}_{speed_name}_{timestamp}"
 
+        self._writer_error = None
         if 'mp4' in formats:
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
             mp4_path = os.path.join(self.output_dir, f"{base_filename}.mp4")
-            self.video_writer = cv2.VideoWriter(mp4_path, fourcc, 60.0,
-                                                (self.app.WIDTH, self.app.HEIGHT))
+            self.video_writer = self._open_video_writer(mp4_path)
+            self._writer_thread = threading.Thread(target=self._consume, daemon=True)
+            self._writer_thread.start()
 
         print(f"Recording {view} view at {speed_multiplier:.2f}x speed for {duration_seconds:.2f} seconds...")
 
@@ -58,31 +74,80 @@ class AncientSimulationRecorder:
             self.app._draw_scene()
             pygame.display.flip()
 
-            frame_surface = pygame.display.get_surface()
-            frame_array = pygame.surfarray.array3d(frame_surface)
-            frame_array = np.rot90(frame_array)
-            frame_array = np.flipud(frame_array)
-
             if 'mp4' in formats and self.video_writer:
-                frame_bgr = cv2.cvtColor(frame_array, cv2.COLOR_RGB2BGR)
-                self.video_writer.write(frame_bgr)
+                frame_surface = pygame.display.get_surface()
+                # pixels3d is a view on the surface memory indexed (x, y); copy it as rows into
+                # the staging buffer, then convert into a free BGR buffer for the writer thread.
+                # The surface stays locked only for the copy, so the next draw is not blocked.
+                frame_surface.lock()
+                frame_pixels = pygame.surfarray.pixels3d(frame_surface)
+                np.copyto(self._rgb_buf, frame_pixels.transpose(1, 0, 2))
+                del frame_pixels
+                frame_surface.unlock()
+                frame_bgr = self._free_bgr_bufs.get()
+                cv2.cvtColor(self._rgb_buf, cv2.COLOR_RGB2BGR, dst=frame_bgr)
+                self._frame_queue.put(frame_bgr)
 
             if (frame_num + 1) % 60 == 0:
                 print(f"Recorded {(frame_num + 1) // 60} seconds...")
 
         if self.video_writer:
+            self._frame_queue.put(None)
+            self._writer_thread.join()
             self.video_writer.release()
-            print(f"MP4 saved: {mp4_path}")
+            self.video_writer = None
+            if self._writer_error:
+                print(f"MP4 recording failed: {self._writer_error}")
+            else:
+                print(f"MP4 saved: {mp4_path}")
 
         self.app.current_view = original_view
         self.app.state.time_multiplier = original_speed
         self.app.state.paused = original_paused
+        self.app.state.dirty = True
         self.app._update_caption()
 
         self.recording = False
         self.frames = []
         print("Recording completed!")
 
+    def _open_video_writer(self, mp4_path):
+        """Opens a hardware-accelerated writer for self.codec, falling back to software mp4v."""
+        frame_size = (self.app.WIDTH, self.app.HEIGHT)
+        # Once the hardware encoder has failed, later recordings skip straight to mp4v instead of
+        # repeating the attempt and its burst of OpenCV/FFmpeg error messages
+        if self.codec != 'mp4v' and self._hw_encoder_available is not False:
+            params = [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            writer = cv2.VideoWriter(mp4_path, cv2.CAP_FFMPEG, cv2.VideoWriter_fourcc(*self.codec), 60.0,
+                                     frame_size, params)
+            self._hw_encoder_available = (writer.isOpened() and writer.get(cv2.VIDEOWRITER_PROP_HW_ACCELERATION)
+                                          != cv2.VIDEO_ACCELERATION_NONE)
+            if self._hw_encoder_available:
+                print(f"Using hardware-accelerated '{self.codec}' encoder.")
+                return writer
+            writer.release()
+            print(f"No hardware encoder for '{self.codec}', falling back to mp4v.")
+
+        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        return cv2.VideoWriter(mp4_path, fourcc, 60.0, frame_size)
+
+    def _consume(self):
+        """Writes queued frames to the video file until the end-of-recording sentinel arrives.
+
+        After a failed write the error is kept and the remaining frames are only handed back to
+        the buffer pool, so the capture loop never waits for a buffer that would not return.
+        """
+        while True:
+            frame_bgr = self._frame_queue.get()
+            if frame_bgr is None:
+                break
+            if self._writer_error is None:
+                try:
+                    self.video_writer.write(frame_bgr)
+                except Exception as error:
+                    self._writer_error = error
+            self._free_bgr_bufs.put(frame_bgr)
+
 
 def add_recording_to_ancient_app():
     """Add recording functionality to the main AncientAntikythera class."""
@@ -98,7 +163,8 @@ def add_recording_to_ancient_app():
                 self._handle_input_with_recording()
                 self.state.update()
 
-            self._draw_scene()
+            if self.state.dirty:  # Nothing changes on screen while paused
+                self._draw_scene()
             self.clock.tick(60)
 
     def _handle_input_with_recording(self):
@@ -106,6 +172,7 @@ def add_recording_to_ancient_app():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
+            self._handle_window_event(event)
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_UP:
                     self.state.change_speed(1.5)
@@ -115,6 +182,7 @@ def add_recording_to_ancient_app():
                     self.state.toggle_pause()
                 elif event.key == pygame.K_TAB:
                     self.current_view = 'back' if self.current_view == 'front' else 'front'
+                    self.state.dirty = True
                     self._update_caption()
 
                 # Recording controls
@@ -1,10 +1,12 @@
 import pygame
 import sys
 import math
+import numpy as np
 
 import ancient_config as config
 from ancient_drawing import AncientRenderer
 from ancient_back_face import AncientBackRenderer
+from ancient_math import update_angles
 
 class AncientSimulationState:
     """Manages the state of the ancient simulation."""
@@ -12,23 +14,29 @@ class AncientSimulationState:
         self.current_day = 0
         self.time_multiplier = 1.0
         self.paused = False
+        self.dirty = True  # Something visible changed since the last drawn frame
         self.body_angles = {name: 0 for name in config.GEOCENTRIC_DATA}
+        self.angles = np.zeros(len(config.GEOCENTRIC_DATA))  # Same values in GEOCENTRIC_DATA order
+        self._names = list(config.GEOCENTRIC_DATA)
+        self._inv_periods = np.array([2 * math.pi / data['period'] for data in config.GEOCENTRIC_DATA.values()])
 
     def update(self):
         if not self.paused:
             self.current_day += self.time_multiplier
             self._update_body_angles()
+            self.dirty = True
 
     def _update_body_angles(self):
-        for name, data in config.GEOCENTRIC_DATA.items():
-            angle = (self.current_day / data['period']) * 2 * math.pi
-            self.body_angles[name] = angle
+        update_angles(self.current_day, self._inv_periods, self.angles)
+        self.body_angles = dict(zip(self._names, self.angles.tolist()))
 
     def change_speed(self, factor):
         self.time_multiplier *= factor
+        self.dirty = True
 
     def toggle_pause(self):
         self.paused = not self.paused
+        self.dirty = True
 
 class AncientAntikythera:
     """Main application class for the ancient simulation."""
@@ -42,6 +50,8 @@ class AncientAntikythera:
         self.back_renderer = AncientBackRenderer(self.screen, self.fonts)
         self.current_view = 'front'
         self.clock = pygame.time.Clock()
+        self._presented_view = None
+        self._prev_dirty_rects = []
 
     def _setup_screen(self):
         info = pygame.display.Info()
@@ -64,7 +74,8 @@ class AncientAntikythera:
         while True:
             self._handle_input()
             self.state.update()
-            self._draw_scene()
+            if self.state.dirty:  # Nothing changes on screen while paused
+                self._draw_scene()
             self.clock.tick(60)
 
     def _handle_input(self):
@@ -72,6 +83,7 @@ class AncientAntikythera:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
+            self._handle_window_event(event)
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_UP:
                     self.state.change_speed(1.5)
@@ -81,30 +93,56 @@ class AncientAntikythera:
                     self.state.toggle_pause()
                 if event.key == pygame.K_TAB:
                     self.current_view = 'back' if self.current_view == 'front' else 'front'
+                    self.state.dirty = True
                     self._update_caption()
 
     def _update_caption(self):
         if self.current_view == 'front':
-            pygame.display.set_caption("Ancient Antikythera - Geocentric View")
+            caption = "Ancient Antikythera - Geocentric View"
         else:
-            pygame.display.set_caption("Ancient Antikythera - Back Dials")
+            caption = "Ancient Antikythera - Back Dials"
+        # Only talk to the window manager when the title actually changes
+        if caption != pygame.display.get_caption()[0]:
+            pygame.display.set_caption(caption)
+
+    def _handle_window_event(self, event):
+        """Redraws the whole window after it was uncovered, restored or resized, even while paused."""
+        if event.type == pygame.WINDOWSIZECHANGED:
+            # The renderers keep their layout and static layers until told the size changed
+            self.front_renderer.on_resize()
+            self.back_renderer.on_resize()
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED,
+                          pygame.WINDOWSIZECHANGED):
+            self._presented_view = None  # Forces a full flip instead of a dirty-rect update
+            self.state.dirty = True
 
     def _draw_scene(self):
+        day = self.state.current_day
         if self.current_view == 'front':
             self.front_renderer.draw_background()
-            self.front_renderer.draw_front_dials(self.state.current_day)
-            self.front_renderer.draw_celestial_bodies(self.state.body_angles)
-            self.front_renderer.draw_moon_phase(self.state.body_angles['Sun'], self.state.body_angles['Moon'])
-            self.front_renderer.draw_ui(self.state.current_day, self.state.time_multiplier)
+            dirty_rects = self.front_renderer.draw_front_dials(day)
+            dirty_rects += self.front_renderer.draw_celestial_bodies(self.state.angles)
+            dirty_rects += self.front_renderer.draw_moon_phase(self.state.body_angles['Sun'], self.state.body_angles['Moon'])
+            dirty_rects += self.front_renderer.draw_ui(day, self.state.time_multiplier)
         else: # Back view
             self.back_renderer.draw_background()
-            self.back_renderer.draw_metonic_dial(self.state.current_day)
-            self.back_renderer.draw_saros_dial(self.state.current_day)
-            self.back_renderer.draw_games_dial(self.state.current_day)
-            self.back_renderer.draw_exeligmos_dial(self.state.current_day)
+            dirty_rects = self.back_renderer.draw_metonic_dial(day)
+            dirty_rects += self.back_renderer.draw_saros_dial(day)
+            dirty_rects += self.back_renderer.draw_games_dial(day)
+            dirty_rects += self.back_renderer.draw_exeligmos_dial(day)
             self.back_renderer.draw_legend()
-            self.back_renderer.draw_ui(self.state.current_day, self.state.time_multiplier)
-        pygame.display.flip()
+            dirty_rects += self.back_renderer.draw_ui(day, self.state.time_multiplier)
+        self._present(dirty_rects)
+        self.state.dirty = False
+
+    def _present(self, dirty_rects):
+        """Shows the frame, pushing only the areas touched by this frame or the previous one."""
+        if self.current_view != self._presented_view:
+            pygame.display.flip()
+            self._presented_view = self.current_view
+        else:
+            pygame.display.update(self._prev_dirty_rects + dirty_rects)
+        self._prev_dirty_rects = dirty_rects
 
 if __name__ == "__main__":
     app = AncientAntikythera()
@@ -5,11 +5,15 @@ for the back dials with a modern aesthetic.
 """
 import pygame
 import math
-from datetime import datetime
+import numpy as np
 import modern_config as config
+from modern_drawing import cached_render, render_if_changed
 
 class ModernBackRenderer:
     """Handles all rendering for the back face of the modern simulation."""
+    ARC_SEGMENTS = 128  # Resolution of the cached progress-ring outlines
+    ARC_WIDTH = 8
+
     def __init__(self, screen, fonts):
         self.screen = screen
         self.fonts = fonts
@@ -22,96 +26,108 @@ class ModernBackRenderer:
         self.games_pos = (self.WIDTH * 0.3, self.HEIGHT * 0.75)
         self.exeligmos_pos = (self.WIDTH * 0.7, self.HEIGHT * 0.75)
 
+        # Dials driven by the day count since 2000: (position, title, cycle length in days, counter text)
+        self._cycle_dials = [
+            (self.metonic_pos, "Metonic Cycle", config.METONIC_CYCLE_YEARS * 365.25,
+             lambda d: f"Year {int(d / 365.25) % config.METONIC_CYCLE_YEARS + 1} / {config.METONIC_CYCLE_YEARS}"),
+            (self.saros_pos, "Saros Cycle", config.SAROS_CYCLE_YEARS * 365.25,
+             lambda d: f"Month {int((d / config.SYNODIC_PERIOD) % config.SAROS_CYCLE_MONTHS)} / {config.SAROS_CYCLE_MONTHS}"),
+            (self.exeligmos_pos, "Exeligmos Cycle", config.EXELIGMOS_CYCLE_YEARS * 365.25,
+             lambda d: f"Saros {int((d / (config.SAROS_CYCLE_YEARS * 365.25)) % config.EXELIGMOS_CYCLE_SAROS) + 1} / {config.EXELIGMOS_CYCLE_SAROS}"),
+        ]
+
+        # Dial sizes never change after start-up
+        self._dial_radius = int(self.WIDTH / 8)
+        self._arc_radius = self._dial_radius - 20
+
+        self._control_surfs = [cached_render(self.fonts['medium'], line, config.BACK_TEXT_COLOR)
+                               for line in ["Controls:", "UP/DOWN: Speed", "SPACE: Pause", "TAB: Switch View"]]
+        self._legend = self._render_legend()
+        self._arc_points = {}
+        self._static_background = self._render_static_background()
+
+    def _render_static_background(self):
+        """Pre-renders the background with every dial face, title and progress track."""
+        background = pygame.Surface((self.WIDTH, self.HEIGHT)).convert()
+        background.fill((10, 15, 30))
+        radius = self._dial_radius
+        dial_titles = [(center, title) for center, title, _, _ in self._cycle_dials]
+        for center, title in dial_titles + [(self.games_pos, "Global Events")]:
+            self._draw_dial_base(background, center, radius, title)
+            track_radius = self._arc_radius
+            rect = pygame.Rect(center[0] - track_radius, center[1] - track_radius, track_radius * 2, track_radius * 2)
+            pygame.draw.arc(background, config.PROGRESS_BG_COLOR, rect, -math.pi/2, 2 * math.pi - math.pi/2, self.ARC_WIDTH)
+        return background
+
     def draw_background(self):
         """Draws a modern, clean background."""
-        self.screen.fill((10, 15, 30))
+        # Dial faces and progress tracks are part of the pre-rendered background
+        self.screen.blit(self._static_background, (0, 0))
 
-    def _draw_dial_base(self, center, radius, title):
+    def _draw_dial_base(self, surface, center, radius, title):
         """Helper to draw the base of a dial."""
-        pygame.draw.circle(self.screen, config.DIAL_BG_COLOR, center, radius)
-        pygame.draw.circle(self.screen, config.DIAL_OUTLINE_COLOR, center, radius, 2)
-
-        title_surface = self.fonts['medium'].render(title, True, config.BACK_TEXT_COLOR)
-        self.screen.blit(title_surface, title_surface.get_rect(center=(center[0], center[1] - radius - 20)))
+        pygame.draw.circle(surface, config.DIAL_BG_COLOR, center, radius)
+        pygame.draw.circle(surface, config.DIAL_OUTLINE_COLOR, center, radius, 2)
+
+        title_surface = cached_render(self.fonts['medium'], title, config.BACK_TEXT_COLOR)
+        surface.blit(title_surface, title_surface.get_rect(center=(center[0], center[1] - radius - 20)))
+
+    def _arc_outline(self, center, radius):
+        """Returns the outer and inner edge points of a full progress ring, computed once per ring."""
+        key = (center, radius)
+        outline = self._arc_points.get(key)
+        if outline is None:
+            angles = np.linspace(-math.pi/2, 2 * math.pi - math.pi/2, self.ARC_SEGMENTS + 1)
+            cos_a, sin_a = np.cos(angles), np.sin(angles)
+            inner_radius = radius - self.ARC_WIDTH
+            # Same orientation as pygame.draw.arc: angles run counterclockwise with y pointing up
+            outer = list(zip((center[0] + radius * cos_a).tolist(), (center[1] - radius * sin_a).tolist()))
+            inner = list(zip((center[0] + inner_radius * cos_a).tolist(), (center[1] - inner_radius * sin_a).tolist()))
+            outline = self._arc_points[key] = (outer, inner)
+        return outline
 
     def _draw_progress_arc(self, center, radius, progress):
-        """Helper to draw a circular progress bar."""
+        """Helper to draw a circular progress bar over its pre-rendered track."""
         if progress <= 0: return
-        rect = pygame.Rect(center[0] - radius, center[1] - radius, radius * 2, radius * 2)
-
-        # Background
-        pygame.draw.arc(self.screen, config.PROGRESS_BG_COLOR, rect, -math.pi/2, 2 * math.pi - math.pi/2, 8)
+        progress = min(progress, 1.0)
+        outer, inner = self._arc_outline(center, radius)
 
-        # Foreground
+        # Foreground: the cached ring outline up to the last whole segment, closed at the exact end angle
+        steps = int(progress * self.ARC_SEGMENTS)
         end_angle = -math.pi/2 + (progress * 2 * math.pi)
-        pygame.draw.arc(self.screen, config.PROGRESS_BAR_COLOR, rect, -math.pi/2, end_angle, 8)
-
-    def draw_metonic_dial(self, simulation_state):
-        """Draws the Metonic cycle dial."""
-        radius = self.WIDTH / 8
-        self._draw_dial_base(self.metonic_pos, radius, "Metonic Cycle")
-
-        total_days = config.METONIC_CYCLE_YEARS * 365.25
-        days_in_cycle = (simulation_state.current_date - datetime(2000, 1, 1)).total_seconds() / (24 * 3600)
-        progress = (days_in_cycle % total_days) / total_days
-
-        self._draw_progress_arc(self.metonic_pos, radius - 20, progress)
-
-        year_in_cycle = int(days_in_cycle / 365.25) % config.METONIC_CYCLE_YEARS + 1
-        text = f"Year {year_in_cycle} / {config.METONIC_CYCLE_YEARS}"
-        surface = self.fonts['medium'].render(text, True, config.BACK_TEXT_COLOR)
-        self.screen.blit(surface, surface.get_rect(center=self.metonic_pos))
-
-    def draw_saros_dial(self, simulation_state):
-        """Draws the Saros eclipse cycle dial."""
-        radius = self.WIDTH / 8
-        self._draw_dial_base(self.saros_pos, radius, "Saros Cycle")
-
-        total_days = config.SAROS_CYCLE_YEARS * 365.25
-        days_in_cycle = (simulation_state.current_date - datetime(2000, 1, 1)).total_seconds() / (24 * 3600)
-        progress = (days_in_cycle % total_days) / total_days
-
-        self._draw_progress_arc(self.saros_pos, radius - 20, progress)
-
-        month_in_cycle = int((days_in_cycle / config.SYNODIC_PERIOD) % config.SAROS_CYCLE_MONTHS)
-        text = f"Month {month_in_cycle} / {config.SAROS_CYCLE_MONTHS}"
-        surface = self.fonts['medium'].render(text, True, config.BACK_TEXT_COLOR)
-        self.screen.blit(surface, surface.get_rect(center=self.saros_pos))
+        cos_e, sin_e = math.cos(end_angle), math.sin(end_angle)
+        inner_radius = radius - self.ARC_WIDTH
+        end_points = [(center[0] + radius * cos_e, center[1] - radius * sin_e),
+                      (center[0] + inner_radius * cos_e, center[1] - inner_radius * sin_e)]
+        pygame.draw.polygon(self.screen, config.PROGRESS_BAR_COLOR, outer[:steps + 1] + end_points + inner[steps::-1])
+
+    def _draw_cycle_dial(self, center, total_days, label_fn, days_since_2000):
+        """Draws the progress arc and counter of one day-count driven cycle dial."""
+        progress = (days_since_2000 % total_days) / total_days
+        self._draw_progress_arc(center, self._arc_radius, progress)
+
+        surface = cached_render(self.fonts['medium'], label_fn(days_since_2000), config.BACK_TEXT_COLOR)
+        self.screen.blit(surface, surface.get_rect(center=center))
+
+    def draw_cycle_dials(self, simulation_state):
+        """Draws the Metonic, Saros and Exeligmos cycle dials."""
+        days_since_2000 = simulation_state.days_since_2000
+        for center, _, total_days, label_fn in self._cycle_dials:
+            self._draw_cycle_dial(center, total_days, label_fn, days_since_2000)
 
     def draw_games_dial(self, simulation_state):
         """Draws the modern 'Games' dial."""
-        radius = self.WIDTH / 8
-        self._draw_dial_base(self.games_pos, radius, "Global Events")
-
         year_in_cycle = simulation_state.current_date.year % 4
         game_name = config.MODERN_GAMES[year_in_cycle]
 
-        text_surface = self.fonts['medium'].render(game_name, True, config.BACK_TEXT_COLOR)
+        text_surface = cached_render(self.fonts['medium'], game_name, config.BACK_TEXT_COLOR)
         self.screen.blit(text_surface, text_surface.get_rect(center=self.games_pos))
 
         progress = (simulation_state.current_date.timetuple().tm_yday / 365)
-        self._draw_progress_arc(self.games_pos, radius - 20, progress)
-
-    def draw_exeligmos_dial(self, simulation_state):
-        """Draws the Exeligmos cycle dial."""
-        radius = self.WIDTH / 8
-        self._draw_dial_base(self.exeligmos_pos, radius, "Exeligmos Cycle")
-
-        total_days = config.EXELIGMOS_CYCLE_YEARS * 365.25
-        days_in_cycle = (simulation_state.current_date - datetime(2000, 1, 1)).total_seconds() / (24 * 3600)
-        progress = (days_in_cycle % total_days) / total_days
-
-        self._draw_progress_arc(self.exeligmos_pos, radius - 20, progress)
-
-        saros_in_cycle = int((days_in_cycle / (config.SAROS_CYCLE_YEARS * 365.25)) % config.EXELIGMOS_CYCLE_SAROS) + 1
-        text = f"Saros {saros_in_cycle} / {config.EXELIGMOS_CYCLE_SAROS}"
-        surface = self.fonts['medium'].render(text, True, config.BACK_TEXT_COLOR)
-        self.screen.blit(surface, surface.get_rect(center=self.exeligmos_pos))
+        self._draw_progress_arc(self.games_pos, self._arc_radius, progress)
 
-    def draw_legend(self):
-        """Draws a legend for the modern back face."""
-        legend_x = 20
-        legend_y = self.HEIGHT - 120
+    def _render_legend(self):
+        """Pre-renders the legend onto a transparent surface."""
         line_height = 25
 
         legend_items = [
@@ -121,23 +137,35 @@ class ModernBackRenderer:
             ("Exeligmos Cycle:", "54-year cycle for more precise eclipse timing.")
         ]
 
-        title_surface = self.fonts['medium'].render("Back Dials Explained", True, config.BACK_TEXT_COLOR)
-        self.screen.blit(title_surface, (legend_x, legend_y))
+        title_surface = cached_render(self.fonts['medium'], "Back Dials Explained", config.BACK_TEXT_COLOR)
+        rows = [(cached_render(self.fonts['small'], title, config.PROGRESS_BAR_COLOR),
+                 cached_render(self.fonts['small'], desc, config.BACK_TEXT_COLOR))
+                for title, desc in legend_items]
+
+        width = max([title_surface.get_width()] +
+                    [title_surf.get_width() + 10 + desc_surf.get_width() for title_surf, desc_surf in rows])
+        height = len(rows) * line_height + max(title_surf.get_height() for title_surf, _ in rows)
+        legend = pygame.Surface((width, height), pygame.SRCALPHA)
+        legend.blit(title_surface, (0, 0))
 
-        for i, (title, desc) in enumerate(legend_items):
-            y_pos = legend_y + (i + 1) * line_height
-            title_surf = self.fonts['small'].render(title, True, config.PROGRESS_BAR_COLOR)
-            desc_surf = self.fonts['small'].render(desc, True, config.BACK_TEXT_COLOR)
-            self.screen.blit(title_surf, (legend_x, y_pos))
-            self.screen.blit(desc_surf, (legend_x + title_surf.get_width() + 10, y_pos))
+        for i, (title_surf, desc_surf) in enumerate(rows):
+            y_pos = (i + 1) * line_height
+            legend.blit(title_surf, (0, y_pos))
+            legend.blit(desc_surf, (title_surf.get_width() + 10, y_pos))
+        return legend.convert_alpha()
+
+    def draw_legend(self):
+        """Draws a legend for the modern back face."""
+        self.screen.blit(self._legend, (20, self.HEIGHT - 120))
 
     def draw_ui(self, simulation_state):
         """Draws the main UI elements."""
         date_text = simulation_state.current_date.strftime("%Y - %b - %d")
-        date_surface = self.fonts['large'].render(f"{date_text}", True, config.BACK_TEXT_COLOR)
+        date_surface = render_if_changed('back_date', self.fonts['large'], date_text, config.BACK_TEXT_COLOR)
         self.screen.blit(date_surface, (10, 10))
 
-        controls = ["Controls:", "UP/DOWN: Speed", "SPACE: Pause", "TAB: Switch View", f"Speed: {simulation_state.time_multiplier:.2f}x"]
-        for i, line in enumerate(controls):
-            text_surface = self.fonts['medium'].render(line, True, config.BACK_TEXT_COLOR)
+        for i, text_surface in enumerate(self._control_surfs):
             self.screen.blit(text_surface, (10, 50 + i * 25))
+        speed_surface = render_if_changed('back_speed', self.fonts['medium'],
+                                          f"Speed: {simulation_state.time_multiplier:.2f}x", config.BACK_TEXT_COLOR)
+        self.screen.blit(speed_surface, (10, 50 + len(self._control_surfs) * 25))
@@ -3,6 +3,7 @@ Configuration data for the Modern Antikythera simulation.
 This file contains static data such as planet properties, calendar details,
 and UI constants.
 """
+import numpy as np
 
 # --- Planet Data for Visualization ---
 # Orbital periods in Earth days
@@ -28,6 +29,14 @@ PLANET_VISUAL_DATA = {
     'Neptune': {'color': (80, 120, 200), 'speed': (360 / ORBITAL_PERIODS['Neptune']), 'size': 9},
 }
 
+# The same planet data as parallel sequences in PLANET_VISUAL_DATA order, for vectorized code
+PLANETS_SOA = {
+    'names': list(PLANET_VISUAL_DATA),
+    'colors': [data['color'] for data in PLANET_VISUAL_DATA.values()],
+    'sizes': np.array([data['size'] for data in PLANET_VISUAL_DATA.values()], dtype=np.int32),
+    'angular_speeds': np.array([data['speed'] for data in PLANET_VISUAL_DATA.values()]),  # Degrees per day
+}
+
 # Data from the Antikythera Mechanism front face
 MONTHS = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
 ZODIAC_INSCRIPTIONS = [
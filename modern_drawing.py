@@ -5,34 +5,91 @@ including the background, celestial bodies, dials, and UI components.
 """
 import pygame
 import math
+import numpy as np
 from datetime import datetime
 import modern_config as config
 
+_MOON_EPOCH_DT = datetime.strptime(config.MOON_EPOCH, "%Y-%m-%d")
+
+# Rendered text surfaces for strings that repeat from frame to frame
+_text_cache = {}
+
+def cached_render(font, text, color, rot=0):
+    """Renders antialiased text, optionally rotated, reusing the surface for repeated requests.
+
+    Only meant for strings drawn from a small fixed set; anything that changes every
+    frame should be rendered directly so the cache does not grow without bound.
+    """
+    key = (id(font), text, color, rot)
+    text_surface = _text_cache.get(key)
+    if text_surface is None:
+        text_surface = font.render(text, True, color)
+        if rot:
+            text_surface = pygame.transform.rotate(text_surface, rot)
+        text_surface = _text_cache[key] = text_surface.convert_alpha()
+    return text_surface
+
+# Last text and surface per UI slot, for captions that change only now and then
+_ui_text_memo = {}
+
+def render_if_changed(slot, font, text, color):
+    """Renders text for a UI slot, reusing the previous surface while the text is unchanged."""
+    memo = _ui_text_memo.get(slot)
+    if memo is None or memo[0] != text:
+        memo = _ui_text_memo[slot] = (text, font.render(text, True, color).convert_alpha())
+    return memo[1]
+
+# Pre-rendered gradient backgrounds, keyed by surface size
+_gradient_cache = {}
+
+def _build_gradient(width, height):
+    """Renders the vertical background gradient into a new surface in one vectorized pass."""
+    gradient = pygame.Surface((width, height)).convert()
+    ratio = (np.arange(height) / height)[:, None]
+    top = np.array(config.BG_COLOR_TOP, dtype=float)
+    bottom = np.array(config.BG_COLOR_BOTTOM, dtype=float)
+    # One color per row, repeated across every column without copying
+    row_colors = (top * (1 - ratio) + bottom * ratio).astype(np.uint8)
+    pygame.surfarray.blit_array(gradient, np.broadcast_to(row_colors, (width, height, 3)))
+    return gradient
+
 def draw_gradient_background(surface):
     """Draws a vertical gradient background."""
-    height = surface.get_height()
-    for y in range(height):
-        ratio = y / height
-        r = int(config.BG_COLOR_TOP[0] * (1 - ratio) + config.BG_COLOR_BOTTOM[0] * ratio)
-        g = int(config.BG_COLOR_TOP[1] * (1 - ratio) + config.BG_COLOR_BOTTOM[1] * ratio)
-        b = int(config.BG_COLOR_TOP[2] * (1 - ratio) + config.BG_COLOR_BOTTOM[2] * ratio)
-        pygame.draw.line(surface, (r, g, b), (0, y), (surface.get_width(), y))
+    size = surface.get_size()
+    gradient = _gradient_cache.get(size)
+    if gradient is None:
+        gradient = _gradient_cache[size] = _build_gradient(*size)
+    surface.blit(gradient, (0, 0))
+
+# Pre-rendered glowing circles (disc plus halo), keyed by (color, radius)
+_glow_cache = {}
+
+def _glow_sprite(color, radius):
+    """Returns a glowing circle, the disc with its translucent halo, rendering it on first use."""
+    key = (color, radius)
+    glow_surface = _glow_cache.get(key)
+    if glow_surface is None:
+        glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
+        pygame.draw.circle(glow_surface, color, (radius * 2, radius * 2), radius)
+        if radius > 2:
+            halo = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
+            pygame.draw.circle(halo, (*color, 30), (radius * 2, radius * 2), radius * 2)
+            pygame.draw.circle(halo, (*color, 50), (radius * 2, radius * 2), int(radius * 1.5))
+            glow_surface.blit(halo, (0, 0))
+        glow_surface = _glow_cache[key] = glow_surface.convert_alpha()
+    return glow_surface
 
 def draw_glowing_circle(surface, color, center, radius):
     """Draws a circle with a glowing effect."""
-    pygame.draw.circle(surface, color, center, radius)
-    if radius > 2:
-        glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*color, 30), (radius * 2, radius * 2), radius * 2)
-        pygame.draw.circle(glow_surface, (*color, 50), (radius * 2, radius * 2), int(radius * 1.5))
-        surface.blit(glow_surface, (center[0] - radius * 2, center[1] - radius * 2))
+    # The disc and its halo come as one sprite, so each planet is a single blit
+    surface.blit(_glow_sprite(color, radius), (center[0] - radius * 2, center[1] - radius * 2))
 
 def draw_small_orbiting_moon(surface, earth_center, earth_radius, simulation_state):
     """Draws the small moon orbiting Earth."""
     moon_size = max(1, int(earth_radius / 2.5))
     moon_orbit_radius = earth_radius + max(5, int(earth_radius * 1.5))
 
-    days_into_cycle = (simulation_state.current_date - datetime.strptime(config.MOON_EPOCH, "%Y-%m-%d")).total_seconds() / (24 * 3600)
+    days_into_cycle = (simulation_state.current_date - _MOON_EPOCH_DT).total_seconds() / (24 * 3600)
     phase = (days_into_cycle / config.SYNODIC_PERIOD) % 1.0
 
     earth_angle_to_sun = simulation_state.planet_angles['Earth']
@@ -46,79 +103,164 @@ def draw_small_orbiting_moon(surface, earth_center, earth_radius, simulation_sta
     pygame.draw.circle(surface, (200, 200, 200), moon_pos, moon_size)
     pygame.draw.line(surface, (70, 70, 70), earth_center, moon_pos, 1)
 
+# Pre-rendered moon phase discs, keyed by (moon_radius, lit_radius)
+_moon_cache = {}
+
+def _moon_sprite(moon_radius, lit_radius):
+    """Returns the moon display (backdrop, dark disc, lit disc and rim), rendering it on first use.
+
+    Lit radii are whole pixels, so at most moon_radius + 1 sprites exist per display size
+    and the grow/shrink animation stays as smooth as drawing it directly.
+    """
+    key = (moon_radius, lit_radius)
+    sprite = _moon_cache.get(key)
+    if sprite is None:
+        half = moon_radius + 11
+        center = (half, half)
+        sprite = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (20, 20, 30), center, moon_radius + 10)
+        pygame.draw.circle(sprite, (80, 80, 80), center, moon_radius)
+        if lit_radius > 0:
+            pygame.draw.circle(sprite, (200, 200, 200), center, lit_radius)
+        pygame.draw.circle(sprite, (128, 128, 128), center, moon_radius, 1)
+        sprite = _moon_cache[key] = sprite.convert_alpha()
+    return sprite
+
 def draw_large_moon_phase(surface, simulation_state, fonts):
     """Draws the large moon phase display."""
     width = surface.get_width()
     moon_radius = int(width / 15)
     moon_display_center = (width - moon_radius - 30, moon_radius + 30)
 
-    pygame.draw.circle(surface, (20, 20, 30), moon_display_center, moon_radius + 10)
-
-    days_into_cycle = (simulation_state.current_date - datetime.strptime(config.MOON_EPOCH, "%Y-%m-%d")).total_seconds() / (24 * 3600)
+    days_into_cycle = (simulation_state.current_date - _MOON_EPOCH_DT).total_seconds() / (24 * 3600)
     phase = (days_into_cycle / config.SYNODIC_PERIOD) % 1.0
 
-    moon_color_lit = (200, 200, 200)
-    moon_color_dark = (80, 80, 80)
-
-    pygame.draw.circle(surface, moon_color_dark, moon_display_center, moon_radius)
-
     lit_radius = 0
     if phase < 0.5:
         lit_radius = (phase / 0.5) * moon_radius
     else:
         lit_radius = (1 - (phase - 0.5) / 0.5) * moon_radius
 
-    if lit_radius > 0:
-        pygame.draw.circle(surface, moon_color_lit, moon_display_center, int(lit_radius))
-
-    pygame.draw.circle(surface, (128, 128, 128), moon_display_center, moon_radius, 1)
+    moon_sprite = _moon_sprite(moon_radius, int(lit_radius))
+    surface.blit(moon_sprite, moon_sprite.get_rect(center=moon_display_center))
 
     phase_index = int((phase * 8 + 0.5)) % 8
     current_phase_name = config.MOON_PHASE_NAMES[phase_index]
-    phase_text_surface = fonts['medium'].render(f"Moon: {current_phase_name}", True, (255, 255, 255))
-    surface.blit(phase_text_surface, (
-        moon_display_center[0] - phase_text_surface.get_width() // 2,
-        moon_display_center[1] + moon_radius + 15
-    ))
+    phase_text_surface = cached_render(fonts['medium'], f"Moon: {current_phase_name}", (255, 255, 255))
+    surface.blit(phase_text_surface, phase_text_surface.get_rect(
+        midtop=(moon_display_center[0], moon_display_center[1] + moon_radius + 15)))
+
+# Pre-rendered Sun and orbit rings, keyed by surface size
+_orbit_layer_cache = {}
+
+def _orbit_layer(size):
+    """Returns the Sun and the orbit rings over the gradient background, with the area they cover.
+
+    The layer is opaque, so blitting just that area replaces the background there without
+    any per-pixel blending.
+    """
+    cached = _orbit_layer_cache.get(size)
+    if cached is None:
+        width = size[0]
+        center = (width // 2, width // 2)
+        layer = _build_gradient(*size)
+        draw_glowing_circle(layer, (255, 180, 0), center, int(width / 48))
+
+        orbit_spacing = int(width / 26.6)
+        base_orbit = int(width / 17)
+        for i in range(len(config.PLANET_VISUAL_DATA)):
+            outer_rect = pygame.draw.circle(layer, (80, 80, 100), center, base_orbit + i * orbit_spacing, 1)
+        cached = _orbit_layer_cache[size] = (layer, outer_rect)
+    return cached
+
+# Per-size planet layout (orbit radii, drawn sizes, label offsets), keyed by surface width
+_planet_layout_cache = {}
+
+def _planet_layout(width):
+    """Returns the orbit radii, drawn planet sizes and label offsets for a given screen width."""
+    layout = _planet_layout_cache.get(width)
+    if layout is None:
+        orbit_spacing = int(width / 26.6)
+        base_orbit = int(width / 17)
+        orbit_radii = base_orbit + np.arange(len(config.PLANETS_SOA['names'])) * orbit_spacing
+        planet_sizes = (config.PLANETS_SOA['sizes'] * (width / 1200)).astype(int)
+        layout = _planet_layout_cache[width] = (orbit_radii, planet_sizes, planet_sizes + 10)
+    return layout
+
+def draw_sun_and_orbits(surface):
+    """Draws the Sun and the orbit rings, which never move."""
+    orbit_layer, orbit_rect = _orbit_layer(surface.get_size())
+    surface.blit(orbit_layer, orbit_rect, orbit_rect)
 
 def draw_celestial_bodies(surface, simulation_state):
-    """Draws the Sun and all planets."""
+    """Draws all planets."""
     width = surface.get_width()
     center = (width // 2, width // 2)
-    sun_radius = int(width / 48)
-    draw_glowing_circle(surface, (255, 180, 0), center, sun_radius)
-
-    orbit_spacing = int(width / 26.6)
-    base_orbit = int(width / 17)
-
-    for i, (name, data) in enumerate(config.PLANET_VISUAL_DATA.items()):
-        orbit_radius = base_orbit + i * orbit_spacing
-        angle = simulation_state.planet_angles[name]
-        x = center[0] + orbit_radius * math.cos(angle)
-        y = center[1] + orbit_radius * math.sin(angle)
-        current_planet_pos = (int(x), int(y))
-        planet_size = int(data['size'] * (width / 1200))
-
-        pygame.draw.circle(surface, (80, 80, 100), center, orbit_radius, 1)
-        draw_glowing_circle(surface, data['color'], current_planet_pos, planet_size)
-
-        label_surface = simulation_state.fonts['planet'].render(name, True, data['color'])
-        label_x = x + (planet_size + 10) * math.cos(angle)
-        label_y = y + (planet_size + 10) * math.sin(angle)
+
+    # Place every planet and label at once; the loop below only draws
+    orbit_radii, planet_sizes, label_offsets = _planet_layout(width)
+    names = config.PLANETS_SOA['names']
+    angles = simulation_state.angles
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    xs = center[0] + orbit_radii * cos_a
+    ys = center[1] + orbit_radii * sin_a
+    label_xs = xs + label_offsets * cos_a
+    label_ys = ys + label_offsets * sin_a
+
+    for name, color, x, y, planet_size, label_x, label_y in zip(
+            names, config.PLANETS_SOA['colors'], xs.astype(int).tolist(), ys.astype(int).tolist(),
+            planet_sizes.tolist(), label_xs.tolist(), label_ys.tolist()):
+        current_planet_pos = (x, y)
+        draw_glowing_circle(surface, color, current_planet_pos, planet_size)
+
+        label_surface = simulation_state.get_text('planet', name, color)
         surface.blit(label_surface, label_surface.get_rect(center=(label_x, label_y)))
 
         if name == 'Earth':
             draw_small_orbiting_moon(surface, current_planet_pos, planet_size, simulation_state)
 
-def draw_calendar_and_zodiac_dials(surface, simulation_state):
-    """Draws the calendar, zodiac, and parapegma dials and the date pointer."""
-    width = surface.get_width()
-    center = (width // 2, width // 2)
-
+# Day-ring directions never change; only their pixel positions depend on the screen size
+_DAYS = np.arange(1, 366)
+_DAY_ANGLES = np.radians((_DAYS / 365.25) * 360 - 90)
+_day_ring_cache = {}
+
+def _day_ring_geometry(center, radius):
+    """Returns the day-ring tick segments and day-label placements, computed once per ring."""
+    key = (center, radius)
+    geometry = _day_ring_cache.get(key)
+    if geometry is None:
+        cos_a, sin_a = np.cos(_DAY_ANGLES), np.sin(_DAY_ANGLES)
+        inner = radius - np.where(_DAYS % 5 == 0, 5, 2)
+        starts = zip((center[0] + inner * cos_a).tolist(), (center[1] + inner * sin_a).tolist())
+        ends = zip((center[0] + radius * cos_a).tolist(), (center[1] + radius * sin_a).tolist())
+        ticks = list(zip(starts, ends))
+
+        labelled = _DAYS % 10 == 0
+        label_angles = _DAY_ANGLES[labelled]
+        label_xs = center[0] + (radius - 15) * np.cos(label_angles)
+        label_ys = center[1] + (radius - 15) * np.sin(label_angles)
+        day_labels = [(str(day), -math.degrees(angle) - 90, (x, y)) for day, angle, x, y in zip(
+            _DAYS[labelled].tolist(), label_angles.tolist(), label_xs.tolist(), label_ys.tolist())]
+
+        geometry = _day_ring_cache[key] = (ticks, day_labels)
+    return geometry
+
+# Pre-rendered dial rings, ticks and inscriptions, keyed by surface size
+_dial_layer_cache = {}
+
+def _dial_radii(width):
+    """Returns the parapegma, zodiac, day-ring and month radii for a given screen width."""
     parapegma_radius = width // 2 - int(width / 30)
     zodiac_radius = parapegma_radius - int(width / 20)
     day_ring_radius = zodiac_radius - int(width / 25)
     month_radius = day_ring_radius - int(width / 25)
+    return parapegma_radius, zodiac_radius, day_ring_radius, month_radius
+
+def _render_dials_static(surface, fonts):
+    """Draws the calendar, zodiac, and parapegma dials, everything except the date pointer."""
+    width = surface.get_width()
+    center = (width // 2, width // 2)
+    parapegma_radius, zodiac_radius, day_ring_radius, month_radius = _dial_radii(width)
 
     # Draw Zodiac Ring
     angle_step_zodiac = 30
@@ -126,7 +268,7 @@ def draw_calendar_and_zodiac_dials(surface, simulation_state):
         angle = math.radians(i * angle_step_zodiac - 90 + (angle_step_zodiac / 2))
         text_x = center[0] + (zodiac_radius - int(width / 60)) * math.cos(angle)
         text_y = center[1] + (zodiac_radius - int(width / 60)) * math.sin(angle)
-        text_surface = simulation_state.fonts['zodiac'].render(sign_name, True, (180, 180, 220))
+        text_surface = cached_render(fonts['zodiac'], sign_name, (180, 180, 220))
         surface.blit(text_surface, text_surface.get_rect(center=(text_x, text_y)))
         tick_angle = math.radians(i * angle_step_zodiac - 90)
         start_pos = (center[0] + (zodiac_radius - 10) * math.cos(tick_angle),
@@ -136,21 +278,12 @@ def draw_calendar_and_zodiac_dials(surface, simulation_state):
         pygame.draw.line(surface, (100, 100, 120), start_pos, end_pos, 2)
 
     # Draw Day Ring
-    for day in range(1, 366):
-        angle = math.radians((day / 365.25) * 360 - 90)
-        tick_length = 5 if day % 5 == 0 else 2
-        start_pos = (center[0] + (day_ring_radius - tick_length) * math.cos(angle),
-                     center[1] + (day_ring_radius - tick_length) * math.sin(angle))
-        end_pos = (
-            center[0] + day_ring_radius * math.cos(angle), center[1] + day_ring_radius * math.sin(angle))
+    ticks, day_labels = _day_ring_geometry(center, day_ring_radius)
+    for start_pos, end_pos in ticks:
         pygame.draw.line(surface, (120, 120, 120), start_pos, end_pos, 1)
-
-        if day % 10 == 0:
-            text_x = center[0] + (day_ring_radius - 15) * math.cos(angle)
-            text_y = center[1] + (day_ring_radius - 15) * math.sin(angle)
-            text_surface = simulation_state.fonts['day'].render(str(day), True, (150, 150, 150))
-            text_surface = pygame.transform.rotate(text_surface, -math.degrees(angle) - 90)
-            surface.blit(text_surface, text_surface.get_rect(center=(text_x, text_y)))
+    for day_text, rotation, text_pos in day_labels:
+        text_surface = cached_render(fonts['day'], day_text, (150, 150, 150), rotation)
+        surface.blit(text_surface, text_surface.get_rect(center=text_pos))
 
     # Draw Month Ring
     angle_step_month = 30
@@ -158,7 +291,7 @@ def draw_calendar_and_zodiac_dials(surface, simulation_state):
         angle = math.radians(i * angle_step_month - 90 + (angle_step_month / 2))
         text_x = center[0] + (month_radius - int(width / 60)) * math.cos(angle)
         text_y = center[1] + (month_radius - int(width / 60)) * math.sin(angle)
-        text_surface = simulation_state.fonts['small'].render(month_name, True, (150, 150, 150))
+        text_surface = cached_render(fonts['small'], month_name, (150, 150, 150))
         surface.blit(text_surface, text_surface.get_rect(center=(text_x, text_y)))
 
     # Draw Parapegma Markers
@@ -168,9 +301,31 @@ def draw_calendar_and_zodiac_dials(surface, simulation_state):
         angle = math.radians((day_of_year / 365.25) * 360 - 90)
         marker_x = int(center[0] + (parapegma_radius - int(width / 60)) * math.cos(angle))
         marker_y = int(center[1] + (parapegma_radius - int(width / 60)) * math.sin(angle))
-        symbol_surface = simulation_state.fonts['parapegma'].render(symbol, True, (255, 223, 0))
+        symbol_surface = cached_render(fonts['parapegma'], symbol, (255, 223, 0))
         surface.blit(symbol_surface, symbol_surface.get_rect(center=(marker_x, marker_y)))
 
+def _dial_layer(size, fonts):
+    """Returns a transparent layer holding the static dials, rendering it on first use."""
+    layer = _dial_layer_cache.get(size)
+    if layer is None:
+        layer = pygame.Surface(size, pygame.SRCALPHA)
+        _render_dials_static(layer, fonts)
+        layer = layer.convert_alpha()
+        # Run-length encoding lets the blit skip the transparent space between the rings
+        layer.set_alpha(255, pygame.RLEACCEL)
+        _dial_layer_cache[size] = layer
+    return layer
+
+def draw_calendar_and_zodiac_dials(surface, simulation_state):
+    """Draws the calendar, zodiac, and parapegma dials and the date pointer."""
+    size = surface.get_size()
+    width = size[0]
+    center = (width // 2, width // 2)
+    parapegma_radius, zodiac_radius, day_ring_radius, month_radius = _dial_radii(width)
+
+    # Rings, ticks and inscriptions never change
+    surface.blit(_dial_layer(size, simulation_state.fonts), (0, 0))
+
     # Draw Date Pointer
     day_of_year = simulation_state.current_date.timetuple().tm_yday
     date_angle = math.radians((day_of_year / 365.25) * 360 - 90)
@@ -183,39 +338,51 @@ def draw_calendar_and_zodiac_dials(surface, simulation_state):
     pygame.draw.line(surface, (255, 100, 100), (start_x, start_y), (end_x, end_y), 2)
     pygame.draw.circle(surface, (255, 100, 100), (int(end_x), int(end_y)), 4)
 
+# Pre-rendered parapegma legend panels, keyed by surface size
+_legend_cache = {}
+
+def _parapegma_legend(size, fonts):
+    """Returns the legend panel with its title and symbol rows, and where to blit it."""
+    legend = _legend_cache.get(size)
+    if legend is None:
+        width, height = size
+        legend_x = 20
+        legend_y = height - int(height / 7)
+        legend_width = int(width / 5.5)
+        legend_height = int(height / 8)
+
+        legend_surface = pygame.Surface((legend_width, legend_height), pygame.SRCALPHA)
+        legend_surface.fill((30, 30, 50, 180))
+        title_surface = cached_render(fonts['medium'], "Parapegma", (255, 255, 255))
+        legend_surface.blit(title_surface, (10, 5))
+
+        y_offset = 30
+        for event, data in config.PARAPEGMA_MARKERS.items():
+            if legend_y + y_offset > height - 20: break
+            symbol_surface = cached_render(fonts['medium'], f"{data['symbol']}:", (255, 223, 0))
+            text_surface = cached_render(fonts['small'], event, (200, 200, 200))
+            legend_surface.blit(symbol_surface, (15, y_offset))
+            legend_surface.blit(text_surface, (55, y_offset + 2))
+            y_offset += int(height / 60)
+        legend = _legend_cache[size] = (legend_surface.convert_alpha(), (legend_x, legend_y))
+    return legend
+
 def draw_parapegma_legend(surface, fonts):
     """Draws the legend for the parapegma symbols."""
-    width = surface.get_width()
-    height = surface.get_height()
-    legend_x = 20
-    legend_y = height - int(height / 7)
-    legend_width = int(width / 5.5)
-    legend_height = int(height / 8)
-
-    legend_surface = pygame.Surface((legend_width, legend_height), pygame.SRCALPHA)
-    legend_surface.fill((30, 30, 50, 180))
-    surface.blit(legend_surface, (legend_x, legend_y))
-
-    title_surface = fonts['medium'].render("Parapegma", True, (255, 255, 255))
-    surface.blit(title_surface, (legend_x + 10, legend_y + 5))
-
-    y_offset = 30
-    for event, data in config.PARAPEGMA_MARKERS.items():
-        if legend_y + y_offset > height - 20: break
-        symbol_surface = fonts['medium'].render(f"{data['symbol']}:", True, (255, 223, 0))
-        text_surface = fonts['small'].render(event, True, (200, 200, 200))
-        surface.blit(symbol_surface, (legend_x + 15, legend_y + y_offset))
-        surface.blit(text_surface, (legend_x + 55, legend_y + y_offset + 2))
-        y_offset += int(height / 60)
+    legend_surface, position = _parapegma_legend(surface.get_size(), fonts)
+    surface.blit(legend_surface, position)
 
 def draw_ui(surface, simulation_state):
     """Draws the main UI elements like date and controls."""
     date_text = simulation_state.current_date.strftime("%Y - %b - %d")
-    date_surface = simulation_state.fonts['large'].render(f"{date_text}", True, (255, 255, 255))
+    date_surface = render_if_changed('front_date', simulation_state.fonts['large'], date_text, (255, 255, 255))
     surface.blit(date_surface, (10, 10))
 
-    controls = ["Controls:", "UP/DOWN: Change Speed", "SPACE: Pause/Resume", f"Speed: {simulation_state.time_multiplier:.2f}x"]
+    controls = ["Controls:", "UP/DOWN: Change Speed", "SPACE: Pause/Resume"]
     for i, line in enumerate(controls):
-        text_surface = simulation_state.fonts['medium'].render(line, True, (200, 200, 200))
+        text_surface = simulation_state.get_text('medium', line, (200, 200, 200))
         surface.blit(text_surface, (10, 50 + i * 25))
+    speed_surface = render_if_changed('front_speed', simulation_state.fonts['medium'],
+                                      f"Speed: {simulation_state.time_multiplier:.2f}x", (200, 200, 200))
+    surface.blit(speed_surface, (10, 50 + len(controls) * 25))
 
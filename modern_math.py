@@ -0,0 +1,24 @@
+"""
+Numeric helpers for the Modern Antikythera Simulation.
+The functions here are compiled with Numba when it is installed and run as
+plain NumPy code otherwise, so Numba stays an optional speed-up.
+"""
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def advance_angles(angles, speeds_rad, time_multiplier, delta_time):
+    """Advances every planet angle in place and returns the number of days that passed.
+
+    speeds_rad holds each planet's angular speed in radians per day.
+    """
+    days = time_multiplier * delta_time
+    angles += speeds_rad * days
+    return days
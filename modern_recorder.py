@@ -1,8 +1,10 @@
 import pygame
 import numpy as np
-import cv2
 import os
-from PIL import Image
+import queue
+import shutil
+import subprocess
+import threading
 from datetime import datetime
 from modern_simulation import ModernAntikythera
 import sys
@@ -11,6 +13,9 @@ import math
 
 class SimulationRecorder:
     """Records the simulation to GIF and MP4 formats."""
+    FRAME_QUEUE_SIZE = 4  # Frames each worker may lag behind before the capture loop waits
+    GIF_FRAME_STEP = 2  # The GIF keeps every other frame, playing at 30 FPS
+    PIPE_BUFFER_SIZE = 16 * 1024 * 1024  # Lets a short ffmpeg stall be absorbed without blocking the worker
 
     def __init__(self, app, output_dir="recordings"):
         self.app = app
@@ -18,10 +23,30 @@ class SimulationRecorder:
         self.recording = False
         self.frames = []
         self.video_writer = None
+        self.ffmpeg_process = None  # Set instead of video_writer when encoding on the GPU
+        self.gif_process = None  # ffmpeg process the GIF frames are streamed to, when ffmpeg is installed
+        self._nvenc_available = None  # Probed on the first MP4 recording
+        # (frame queue, thread, frame step) for each running worker; the capture loop feeds
+        # each queue every frame-step-th frame
+        self._workers = []
+        self._worker_errors = {}  # Exception that stopped a worker, keyed by worker name
+        # Ring of frame buffers, allocated by the first recording and reused by every later one
+        self._frame_ring = None
+        # SDL's usual 32-bit display format stores pixels as B, G, R, X bytes on little-endian machines
+        surface = pygame.display.get_surface()
+        self._raw_bgrx = (surface.get_bytesize() == 4 and surface.get_shifts()[:3] == (16, 8, 0)
+                          and sys.byteorder == 'little')
         os.makedirs(output_dir, exist_ok=True)
 
     def start_recording(self, view, speed_multiplier, duration_seconds=10, formats=['mp4']):
         """Start recording a specific view at a given speed."""
+        # The recording advances the state itself, one update per frame; holding the state
+        # lock keeps the app's update thread from moving it between captured frames.
+        with self.app.simulation_state.lock:
+            self._record(view, speed_multiplier, duration_seconds, formats)
+
+    def _record(self, view, speed_multiplier, duration_seconds, formats):
+        """Records the given view frame by frame."""
         if self.recording:
             print("Already recording!")
             return
@@ -42,69 +67,234 @@ class SimulationRecorder:
         speed_name = f"speed_{speed_multiplier:.2f}x".replace('.', '_')
         base_filename = f"antikythera_{view}_{speed_name}_{timestamp}"
 
+        self._worker_errors = {}
         if 'mp4' in formats:
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
             mp4_path = os.path.join(self.output_dir, f"{base_filename}.mp4")
-            self.video_writer = cv2.VideoWriter(mp4_path, fourcc, 60.0,
-                                                (self.app.WIDTH, self.app.HEIGHT))
+            self._open_video_output(mp4_path)
+            self._start_worker('mp4', self._encode_frames)
+        if 'gif' in formats:
+            gif_path = os.path.join(self.output_dir, f"{base_filename}.gif")
+            self._open_gif_output(gif_path)
+            self._start_worker('gif', self._collect_gif_frames, frame_step=self.GIF_FRAME_STEP)
 
         print(f"Recording {view} view at {speed_multiplier:.2f}x speed for {duration_seconds:.2f} seconds...")
 
-        clock = pygame.time.Clock()
         frames_to_record = int(duration_seconds * 60)  # 60 FPS
+        if self._frame_ring is None:
+            self._frame_ring = self._allocate_frame_ring()
 
         for frame_num in range(frames_to_record):
-            delta_time = clock.tick(60) / 1000.0 * 60
-            self.app.simulation_state.update(delta_time)
+            # Every recorded frame is one 1/60 s step of the video, however long it took to
+            # draw and encode, so the loop runs as fast as it can instead of waiting on a clock
+            self.app.simulation_state.update(1.0)
 
             self.app._draw_scene()
             pygame.display.flip()
 
-            frame_surface = pygame.display.get_surface()
-            frame_array = pygame.surfarray.array3d(frame_surface)
-            frame_array = np.rot90(frame_array)
-            frame_array = np.flipud(frame_array)
-
-            if 'gif' in formats:
-                self.frames.append(frame_array.copy())
-
-            if 'mp4' in formats and self.video_writer:
-                frame_bgr = cv2.cvtColor(frame_array, cv2.COLOR_RGB2BGR)
-                self.video_writer.write(frame_bgr)
+            if self._workers:
+                frame = self._frame_ring[frame_num % len(self._frame_ring)]
+                self._capture_frame(frame)
+                for frame_queue, _, frame_step in self._workers:
+                    if frame_num % frame_step == 0:
+                        frame_queue.put(frame)
 
             if (frame_num + 1) % 60 == 0:
-                print(f"Recorded {(frame_num + 1) // 60} seconds...")
+                # A queue that stays full means that output is slower than drawing
+                backlog = ', '.join(f"{thread.name} {frame_queue.qsize()}/{frame_queue.maxsize}"
+                                    for frame_queue, thread, _ in self._workers)
+                print(f"Recorded {(frame_num + 1) // 60} seconds... (queued frames: {backlog or 'none'})")
 
-        if self.video_writer:
-            self.video_writer.release()
-            print(f"MP4 saved: {mp4_path}")
+        for frame_queue, thread, _ in self._workers:
+            frame_queue.put(None)
+            thread.join()
+        self._workers = []
 
-        if 'gif' in formats and self.frames:
-            gif_path = os.path.join(self.output_dir, f"{base_filename}.gif")
-            self._save_gif(gif_path)
-            print(f"GIF saved: {gif_path}")
+        if 'mp4' in formats:
+            error = self._worker_errors.get('mp4')
+            if self.ffmpeg_process:
+                # Always close and wait on ffmpeg, even after a worker error, so no process is left behind
+                ffmpeg_error = self._finish_ffmpeg(self.ffmpeg_process)
+                error = error or ffmpeg_error
+                self.ffmpeg_process = None
+            else:
+                self.video_writer.release()
+                self.video_writer = None
+            self._report_output('MP4', mp4_path, error)
+
+        if 'gif' in formats:
+            error = self._worker_errors.get('gif')
+            if self.gif_process:
+                ffmpeg_error = self._finish_ffmpeg(self.gif_process)
+                error = error or ffmpeg_error
+                self.gif_process = None
+                self._report_output('GIF', gif_path, error)
+            elif error or self.frames:
+                if not error:
+                    self._save_gif(gif_path)
+                self._report_output('GIF', gif_path, error)
 
         self.app.current_view = original_view
         self.app.simulation_state.time_multiplier = original_speed
         self.app.simulation_state.paused = original_paused
+        self.app.simulation_state.dirty = True
         self.app._update_caption()
 
         self.recording = False
         self.frames = []
         print("Recording completed!")
 
+    def _allocate_frame_ring(self):
+        """Returns the preallocated BGR buffers that captured frames are written into round-robin.
+
+        BGR is the layout cv2, ffmpeg and Pillow all read without converting. A worker may still
+        hold a full queue plus the frame in its hand, FRAME_QUEUE_SIZE + 1 frames taken every
+        GIF_FRAME_STEP captures for the GIF, so the oldest of them can be that many steps behind
+        the capture being written. One more buffer than that span keeps the slot being written
+        distinct from every frame still in use. Memory use is fixed, however long or many the
+        recordings are.
+        """
+        ring_size = (self.FRAME_QUEUE_SIZE + 1) * self.GIF_FRAME_STEP + 1
+        return [np.empty((self.app.HEIGHT, self.app.WIDTH, 3), dtype=np.uint8)
+                for _ in range(ring_size)]
+
+    def _capture_frame(self, frame):
+        """Converts the displayed frame into frame as BGR rows, top to bottom, in a single pass."""
+        import cv2  # Loaded on first use, so the app starts without the recording libraries
+        surface = pygame.display.get_surface()
+        if self._raw_bgrx:
+            # Read the rows straight out of the display's memory, skipping the padding at each row end
+            pixels = np.frombuffer(surface.get_buffer(), np.uint8).reshape(self.app.HEIGHT, -1, 4)
+            cv2.cvtColor(pixels[:, :self.app.WIDTH], cv2.COLOR_BGRA2BGR, dst=frame)
+            del pixels  # Releases the buffer, unlocking the surface
+        else:
+            frame_bytes = pygame.image.tobytes(surface, 'BGRA')
+            pixels = np.frombuffer(frame_bytes, np.uint8).reshape(self.app.HEIGHT, self.app.WIDTH, 4)
+            cv2.cvtColor(pixels, cv2.COLOR_BGRA2BGR, dst=frame)
+
+    def _open_video_output(self, mp4_path):
+        """Pipes frames to an ffmpeg NVENC encoder when available, otherwise opens a cv2 mp4v writer."""
+        if self._nvenc_available is None:
+            self._nvenc_available = self._probe_nvenc()
+        if self._nvenc_available:
+            print("Using the NVENC hardware encoder.")
+            self.ffmpeg_process = subprocess.Popen(
+                ['ffmpeg', '-y', '-loglevel', 'error',
+                 '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', f'{self.app.WIDTH}x{self.app.HEIGHT}', '-r', '60',
+                 '-i', '-', '-c:v', 'h264_nvenc', '-preset', 'p4', '-pix_fmt', 'yuv420p', mp4_path],
+                stdin=subprocess.PIPE, bufsize=self.PIPE_BUFFER_SIZE)
+            return
+
+        import cv2
+        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        self.video_writer = cv2.VideoWriter(mp4_path, fourcc, 60.0,
+                                            (self.app.WIDTH, self.app.HEIGHT))
+
+    @staticmethod
+    def _probe_nvenc():
+        """Returns True if ffmpeg is installed and can encode a short test clip with h264_nvenc."""
+        if shutil.which('ffmpeg') is None:
+            return False
+        try:
+            result = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-loglevel', 'error', '-f', 'lavfi', '-i', 'nullsrc=s=256x256:d=0.1',
+                 '-c:v', 'h264_nvenc', '-f', 'null', '-'],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0
+
+    def _start_worker(self, name, target, frame_step=1):
+        """Starts a thread named name that runs target on its own bounded queue, fed every frame_step-th frame."""
+        # Blocks the capture loop if the worker falls behind; the frame ring is sized from the same limit
+        frame_queue = queue.Queue(maxsize=self.FRAME_QUEUE_SIZE)
+        thread = threading.Thread(target=self._run_worker, args=(name, target, frame_queue), name=name, daemon=True)
+        thread.start()
+        self._workers.append((frame_queue, thread, frame_step))
+
+    def _run_worker(self, name, target, frame_queue):
+        """Runs target on frame_queue; if it fails, keeps the error and drains the queue until the sentinel.
+
+        A dead worker would otherwise leave the capture loop blocked on a full queue for good,
+        with the state lock held and the app frozen.
+        """
+        try:
+            target(frame_queue)
+        except Exception as error:
+            self._worker_errors[name] = error
+            while frame_queue.get() is not None:
+                pass
+
+    @staticmethod
+    def _finish_ffmpeg(process):
+        """Closes ffmpeg's input and waits for it to finish; returns an error message if it failed."""
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass  # ffmpeg already exited; its return code says why
+        returncode = process.wait()
+        return f"ffmpeg exited with code {returncode}" if returncode else None
+
+    @staticmethod
+    def _report_output(kind, path, error):
+        """Tells the user whether an output file was written."""
+        if error:
+            print(f"{kind} recording failed: {error}")
+        else:
+            print(f"{kind} saved: {path}")
+
+    def _encode_frames(self, frame_queue):
+        """Writes queued frames to the video output until the sentinel arrives."""
+        while True:
+            frame = frame_queue.get()
+            if frame is None:
+                break
+            if self.ffmpeg_process:
+                self.ffmpeg_process.stdin.write(frame)
+            else:
+                self.video_writer.write(frame)
+
+    def _collect_gif_frames(self, frame_queue):
+        """Passes queued frames on to the GIF until the sentinel arrives."""
+        from PIL import Image
+        frame_size = (self.app.WIDTH, self.app.HEIGHT)
+        while True:
+            frame = frame_queue.get()
+            if frame is None:
+                break
+            if self.gif_process:
+                self.gif_process.stdin.write(frame)
+            else:
+                # Pillow can only write a GIF once it has every frame, so without ffmpeg all of
+                # them are kept until _save_gif and memory still grows with the recording length.
+                # Reducing each frame to the 8-bit palette image the GIF stores right away keeps
+                # that to a third and does the palette work while still recording.
+                image = Image.frombuffer('RGB', frame_size, frame, 'raw', 'BGR', 0, 1)
+                self.frames.append(image.convert('P', palette=Image.Palette.ADAPTIVE))
+
+    def _open_gif_output(self, gif_path):
+        """Starts an ffmpeg process that encodes the GIF as frames arrive, if ffmpeg is installed."""
+        if not shutil.which('ffmpeg'):
+            return
+        # palettegen builds a palette for each frame on its own (stats_mode=single) and paletteuse
+        # applies it to that frame right away (new=1), so ffmpeg writes frames as they arrive.
+        # A single palette for the whole clip could only be built at the end of the input, with
+        # ffmpeg holding every raw frame until then.
+        self.gif_process = subprocess.Popen(
+            ['ffmpeg', '-y', '-loglevel', 'error',
+             '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', f'{self.app.WIDTH}x{self.app.HEIGHT}', '-r', '30',
+             '-i', '-', '-vf', 'split[a][b];[a]palettegen=stats_mode=single[p];[b][p]paletteuse=new=1', '-loop', '0', gif_path],
+            stdin=subprocess.PIPE, bufsize=self.PIPE_BUFFER_SIZE)
+
     def _save_gif(self, filepath):
-        """Save frames as GIF."""
-        images = [Image.fromarray(frame) for frame in self.frames[::2]]
-        images[0].save(
+        """Save the collected palette frames as GIF; only used without ffmpeg, when every frame was kept."""
+        self.frames[0].save(
             filepath,
             save_all=True,
-            append_images=images[1:],
+            append_images=self.frames[1:],
             duration=33,  # ~30 FPS
             loop=0
         )
 
-
 def add_recording_to_main_app():
     """Add recording functionality to the main ModernAntikythera class."""
 
@@ -115,51 +305,56 @@ def add_recording_to_main_app():
     def run_with_recording(self):
         """Enhanced run method with recording capabilities."""
         clock = pygame.time.Clock()
+        self._start_update_thread()
         running = True
         while running:
-            # The delta_time calculation normalizes frame rate to 60 updates per second
-            # Each update advances the simulation by `time_multiplier` days.
-            delta_time = clock.tick(60) / 1000.0 * 60
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_UP:
-                        self.simulation_state.time_multiplier *= 1.5
-                    if event.key == pygame.K_DOWN:
-                        self.simulation_state.time_multiplier /= 1.5
-                    if event.key == pygame.K_SPACE:
-                        self.simulation_state.paused = not self.simulation_state.paused
-                    if event.key == pygame.K_TAB:
-                        self.current_view = 'back' if self.current_view == 'front' else 'front'
-                        self._update_caption()
-
-                    # Recording controls
-                    if event.key == pygame.K_r:
-                        current_speed = self.simulation_state.time_multiplier
-                        print(f"Starting 5-second recording of the front view at {current_speed:.2f}x speed...")
-                        self.recorder.start_recording('front', current_speed, 5, ['mp4'])
-
-                    if event.key == pygame.K_b:
-                        current_speed = self.simulation_state.time_multiplier
-                        print(f"Starting 5-second recording of the back view at {current_speed:.2f}x speed...")
-                        self.recorder.start_recording('back', current_speed, 5, ['mp4'])
-
-                    if event.key == pygame.K_c:
-                        current_speed = self.simulation_state.time_multiplier
-                        # Calculate duration to record 365 simulation days
-                        # Each second of recording at 60fps covers (60 * current_speed) days
-                        duration = 365 / (60 * current_speed)
-                        print(f"Starting 365-day cycle recording of the front view at {current_speed:.2f}x speed...")
-                        self.recorder.start_recording('front', current_speed, duration, ['mp4'])
-
-            if not self.recorder.recording:
-                self.simulation_state.update(delta_time)
-
-            self._draw_scene()
-            pygame.display.flip()
-
+            # The update thread advances the simulation by `time_multiplier` days per 1/60 s;
+            # holding the lock here keeps it from advancing while keys are handled or a recording runs.
+            with self.simulation_state.lock:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        running = False
+                    self._handle_window_event(event)
+                    if event.type == pygame.KEYDOWN:
+                        self.simulation_state.dirty = True  # Speed, pause and view changes all show on screen
+                        if event.key == pygame.K_UP:
+                            self.simulation_state.time_multiplier *= 1.5
+                        if event.key == pygame.K_DOWN:
+                            self.simulation_state.time_multiplier /= 1.5
+                        if event.key == pygame.K_SPACE:
+                            self.simulation_state.paused = not self.simulation_state.paused
+                        if event.key == pygame.K_TAB:
+                            self.current_view = 'back' if self.current_view == 'front' else 'front'
+                            self._update_caption()
+
+                        # Recording controls
+                        if event.key == pygame.K_r:
+                            current_speed = self.simulation_state.time_multiplier
+                            print(f"Starting 5-second recording of the front view at {current_speed:.2f}x speed...")
+                            self.recorder.start_recording('front', current_speed, 5, ['mp4'])
+
+                        if event.key == pygame.K_b:
+                            current_speed = self.simulation_state.time_multiplier
+                            print(f"Starting 5-second recording of the back view at {current_speed:.2f}x speed...")
+                            self.recorder.start_recording('back', current_speed, 5, ['mp4'])
+
+                        if event.key == pygame.K_c:
+                            current_speed = self.simulation_state.time_multiplier
+                            # Calculate duration to record 365 simulation days
+                            # Each second of recording at 60fps covers (60 * current_speed) days
+                            duration = 365 / (60 * current_speed)
+                            print(f"Starting 365-day cycle recording of the front view at {current_speed:.2f}x speed...")
+                            self.recorder.start_recording('front', current_speed, duration, ['mp4'])
+
+                # Nothing changes on screen while paused
+                state = self.simulation_state.snapshot() if self.simulation_state.dirty else None
+
+            if state is not None:
+                self._draw_scene(state)
+                pygame.display.flip()
+            clock.tick(60)
+
+        self._stop_update_thread()
         pygame.quit()
         sys.exit()
 
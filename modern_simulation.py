@@ -5,19 +5,29 @@ time multiplier, and planet angles. It also contains the main application loop.
 """
 import pygame
 import sys
-import math
+import copy
+import threading
+import numpy as np
 from datetime import datetime, timedelta
 import modern_config as config
 import modern_drawing as drawing
 from modern_back_face import ModernBackRenderer
+from modern_math import advance_angles
+
+_EPOCH = datetime(2000, 1, 1)  # Reference date for the back-face cycles
 
 class SimulationState:
     """Manages the state of the simulation."""
     def __init__(self, width):
         self.current_date = datetime.now()
+        self.days_since_2000 = (self.current_date - _EPOCH).total_seconds() / (24 * 3600)
         self.time_multiplier = 1.0
         self.paused = False
-        self.planet_angles = {name: math.radians(i * 45) for i, name in enumerate(config.PLANET_VISUAL_DATA)}
+        self.dirty = True  # Something visible changed since the last drawn frame
+        self.lock = threading.RLock()  # Held while the state is read or changed across threads
+        # Planet angles in radians, in PLANETS_SOA order, advanced with one vector operation per update
+        self.angles = np.radians(np.arange(len(config.PLANETS_SOA['names'])) * 45.0)
+        self._speeds_rad = np.radians(config.PLANETS_SOA['angular_speeds'])  # Radians per day
 
         self.fonts = {
             'small': pygame.font.SysFont('Arial', int(width / 85)),
@@ -29,13 +39,29 @@ class SimulationState:
             'parapegma': pygame.font.SysFont('Arial', int(width / 65), bold=True)
         }
 
+    def get_text(self, font_key, text, color):
+        """Returns the rendered surface for text in one of the state's fonts, rendering it only once."""
+        return drawing.cached_render(self.fonts[font_key], text, color)
+
     def update(self, delta_time):
         """Updates the simulation state."""
         if not self.paused:
-            self.current_date += timedelta(days=self.time_multiplier * delta_time)
-            for name, data in config.PLANET_VISUAL_DATA.items():
-                angle_change = math.radians(data['speed'] * self.time_multiplier * delta_time)
-                self.planet_angles[name] += angle_change
+            days = advance_angles(self.angles, self._speeds_rad, self.time_multiplier, delta_time)
+            self.current_date += timedelta(days=days)
+            self.days_since_2000 = (self.current_date - _EPOCH).total_seconds() / (24 * 3600)
+            self.dirty = True
+
+    def snapshot(self):
+        """Returns a copy of the state to draw from and clears the dirty flag. Call with the lock held."""
+        state = copy.copy(self)
+        state.angles = self.angles.copy()
+        self.dirty = False
+        return state
+
+    @property
+    def planet_angles(self):
+        """The planet angles keyed by planet name."""
+        return dict(zip(config.PLANETS_SOA['names'], self.angles.tolist()))
 
 class ModernAntikythera:
     """Main application class."""
@@ -51,57 +77,96 @@ class ModernAntikythera:
         self.front_renderer = drawing
         self.back_renderer = ModernBackRenderer(self.screen, self.simulation_state.fonts)
         self.current_view = 'front'
+        self._front_static = self._render_front_static()
+
+    def _render_front_static(self):
+        """Pre-renders the parts of the front view that never move: background, Sun, orbits and legend."""
+        static = pygame.Surface((self.WIDTH, self.HEIGHT)).convert()
+        self.front_renderer.draw_gradient_background(static)
+        self.front_renderer.draw_sun_and_orbits(static)
+        self.front_renderer.draw_parapegma_legend(static, self.simulation_state.fonts)
+        return static
 
     def run(self):
         """Main application loop."""
         clock = pygame.time.Clock()
+        self._start_update_thread()
         running = True
         while running:
-            delta_time = clock.tick(60) / 1000.0 * 60 # Normalize to 60 FPS
+            with self.simulation_state.lock:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        running = False
+                    self._handle_window_event(event)
+                    if event.type == pygame.KEYDOWN:
+                        self.simulation_state.dirty = True  # Speed, pause and view changes all show on screen
+                        if event.key == pygame.K_UP:
+                            self.simulation_state.time_multiplier *= 1.5
+                        if event.key == pygame.K_DOWN:
+                            self.simulation_state.time_multiplier /= 1.5
+                        if event.key == pygame.K_SPACE:
+                            self.simulation_state.paused = not self.simulation_state.paused
+                        if event.key == pygame.K_TAB:
+                            self.current_view = 'back' if self.current_view == 'front' else 'front'
+                            self._update_caption()
+                # Nothing changes on screen while paused
+                state = self.simulation_state.snapshot() if self.simulation_state.dirty else None
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_UP:
-                        self.simulation_state.time_multiplier *= 1.5
-                    if event.key == pygame.K_DOWN:
-                        self.simulation_state.time_multiplier /= 1.5
-                    if event.key == pygame.K_SPACE:
-                        self.simulation_state.paused = not self.simulation_state.paused
-                    if event.key == pygame.K_TAB:
-                        self.current_view = 'back' if self.current_view == 'front' else 'front'
-                        self._update_caption()
-
-            self.simulation_state.update(delta_time)
-            self._draw_scene()
-            pygame.display.flip()
+            if state is not None:
+                self._draw_scene(state)
+                pygame.display.flip()
+            clock.tick(60)
 
+        self._stop_update_thread()
         pygame.quit()
         sys.exit()
 
+    def _start_update_thread(self):
+        """Starts advancing the simulation state on a background thread, so drawing never waits for it."""
+        self._stop_updates = threading.Event()
+        self._update_thread = threading.Thread(target=self._update_loop, daemon=True)
+        self._update_thread.start()
+
+    def _stop_update_thread(self):
+        self._stop_updates.set()
+        self._update_thread.join()
+
+    def _update_loop(self):
+        """Advances the state at a fixed 60 Hz tick until stopped."""
+        clock = pygame.time.Clock()
+        while not self._stop_updates.is_set():
+            delta_time = clock.tick(60) / 1000.0 * 60 # Normalize to 60 FPS
+            with self.simulation_state.lock:
+                self.simulation_state.update(delta_time)
+
     def _update_caption(self):
         if self.current_view == 'front':
             pygame.display.set_caption("Modern Antikythera - Solar System View")
         else:
             pygame.display.set_caption("Modern Antikythera - Astronomical Cycles")
 
-    def _draw_scene(self):
+    def _handle_window_event(self, event):
+        """Redraws the window after it was uncovered, restored or resized, even while paused."""
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED,
+                          pygame.WINDOWSIZECHANGED):
+            self.simulation_state.dirty = True
+
+    def _draw_scene(self, state=None):
+        """Draws the current view from state, a snapshot of the simulation state, or the live state."""
+        if state is None:
+            state = self.simulation_state
         if self.current_view == 'front':
-            self.front_renderer.draw_gradient_background(self.screen)
-            self.front_renderer.draw_celestial_bodies(self.screen, self.simulation_state)
-            self.front_renderer.draw_calendar_and_zodiac_dials(self.screen, self.simulation_state)
-            self.front_renderer.draw_large_moon_phase(self.screen, self.simulation_state, self.simulation_state.fonts)
-            self.front_renderer.draw_parapegma_legend(self.screen, self.simulation_state.fonts)
-            self.front_renderer.draw_ui(self.screen, self.simulation_state)
+            self.screen.blit(self._front_static, (0, 0))
+            self.front_renderer.draw_celestial_bodies(self.screen, state)
+            self.front_renderer.draw_calendar_and_zodiac_dials(self.screen, state)
+            self.front_renderer.draw_large_moon_phase(self.screen, state, state.fonts)
+            self.front_renderer.draw_ui(self.screen, state)
         else: # Back view
             self.back_renderer.draw_background()
-            self.back_renderer.draw_metonic_dial(self.simulation_state)
-            self.back_renderer.draw_saros_dial(self.simulation_state)
-            self.back_renderer.draw_games_dial(self.simulation_state)
-            self.back_renderer.draw_exeligmos_dial(self.simulation_state)
+            self.back_renderer.draw_cycle_dials(state)
+            self.back_renderer.draw_games_dial(state)
             self.back_renderer.draw_legend()
-            self.back_renderer.draw_ui(self.simulation_state)
+            self.back_renderer.draw_ui(state)
 
 if __name__ == '__main__':
     app = ModernAntikythera()